@@ -4,19 +4,199 @@ Branch & Bound Solver for 0/1 Knapsack
 Alternative method using Branch and Bound (finds top-N solutions)
 """
 
+import heapq
+from bisect import bisect_right
+from itertools import accumulate
+import os
+
 from knapsack_core import KnapsackEngine
 
+# Worst value in the best top-N found by any worker (set per worker process)
+_shared_worst = None
+
+
+def bnb_search(values, weights, capacity, order, top_n, memo_limit=200_000,
+               root=(0, 0, 0, 0), shared_worst=None, node_budget=None):
+    """Branch & Bound kernel over plain sequences and int bitmasks
+    
+    Self-contained (no solver attribute lookups) so the hot loop only
+    touches locals. Branches over the free items in order (forced items
+    are already folded into root); each node is (level, value, weight,
+    chosen) with bit i of chosen set when item i is picked. The search
+    starts from root, so a subtree can be searched on its own.
+    
+    shared_worst, if given, is a multiprocessing.Value holding the best
+    "worst value in a full top-N" published by any subtree search. Any
+    subtree's full top-N is a lower bound on the global one, so it is a
+    valid pruning threshold for every other subtree.
+    
+    node_budget, if given, stops the search after that many nodes; the
+    nodes still waiting on the stack are handed back so their subtrees
+    can be searched elsewhere.
+    
+    Returns (top_heap, nodes_explored, frontier), where top_heap is a
+    min-heap of up to top_n (value, tiebreak, chosen) entries and frontier
+    lists the unexplored nodes, next-to-search first (empty when the
+    search ran to completion).
+    """
+    n = len(order)
+    top_heap = []
+    in_top = set()  # Bitmasks currently in top_heap (greedy seeds can recur as leaves)
+    memo = {}  # (level, remaining capacity) -> (fractional fill value, greedy prefix end)
+    
+    # Prefix sums over the ratio order: cum_weight[j] = weight of order[:j]
+    cum_weight = list(accumulate((weights[i] for i in order), initial=0))
+    cum_value = list(accumulate((values[i] for i in order), initial=0))
+    cum_mask = list(accumulate((1 << i for i in order), lambda a, b: a | b, initial=0))
+    # Lightest undecided item from each level on: below it, nothing else fits
+    suffix_min_weight = list(accumulate((weights[i] for i in reversed(order)), min,
+                                        initial=float('inf')))[::-1]
+    nodes = 0
+    neg_inf = float('-inf')
+    external_worst = neg_inf
+    stack = [root]
+    pop = stack.pop
+    push = stack.append
+    
+    def offer(value, chosen):
+        """Insert a feasible selection into the bounded top-N heap"""
+        if chosen in in_top:
+            return
+        # The node counter breaks ties so bitmasks are never compared
+        entry = (value, nodes, chosen)
+        if len(top_heap) < top_n:
+            heapq.heappush(top_heap, entry)
+        elif value > top_heap[0][0]:
+            in_top.discard(heapq.heapreplace(top_heap, entry)[2])
+        else:
+            return
+        in_top.add(chosen)
+        
+        if shared_worst is not None and len(top_heap) == top_n:
+            with shared_worst.get_lock():
+                if top_heap[0][0] > shared_worst.value:
+                    shared_worst.value = top_heap[0][0]
+    
+    while stack:
+        if nodes == node_budget:
+            break
+        level, current_value, current_weight, chosen = pop()
+        nodes += 1
+        
+        # Pick up the threshold published by other subtrees now and then
+        if shared_worst is not None and not nodes & 1023:
+            external_worst = shared_worst.value
+        
+        # Prune if over capacity
+        if current_weight > capacity:
+            continue
+        
+        # Leaf: all items considered, or no undecided item fits any more
+        # (the subtree then holds this one selection only)
+        remaining = capacity - current_weight
+        if level == n or remaining < suffix_min_weight[level]:
+            offer(current_value, chosen)
+            continue
+        
+        # Upper bound by fractional relaxation over the undecided suffix
+        key = (level, remaining)
+        cached = memo.get(key)
+        if cached is None:
+            # Greedy fill = longest prefix of order[level:] that fits,
+            # plus a fraction of the first item that does not
+            k = bisect_right(cum_weight, cum_weight[level] + remaining, level) - 1
+            tail = cum_value[k] - cum_value[level]
+            if k < n:
+                i = order[k]
+                tail += values[i] / weights[i] * (remaining - (cum_weight[k] - cum_weight[level]))
+            # FIFO eviction keeps the memo bounded on large capacities
+            if len(memo) >= memo_limit:
+                del memo[next(iter(memo))]
+            memo[key] = (tail, k)
+        else:
+            tail, k = cached
+        
+        # Prune if bound <= worst in top-N
+        worst_in_top = top_heap[0][0] if len(top_heap) == top_n else neg_inf
+        if current_value + tail <= max(worst_in_top, external_worst):
+            continue
+        
+        # Seed the incumbents with the integer greedy completion (the fitting
+        # prefix, nothing after it): a feasible leaf found in O(1) that
+        # tightens worst_in_top long before the DFS reaches it
+        greedy_value = current_value + cum_value[k] - cum_value[level]
+        if greedy_value > worst_in_top:
+            offer(greedy_value, chosen | (cum_mask[k] ^ cum_mask[level]))
+        
+        # Branch on the next item in ratio order
+        item = order[level]
+        bit = 1 << item
+        
+        # Push exclude first so the include branch is explored first
+        push((level + 1, current_value, current_weight, chosen))
+        if current_weight + weights[item] <= capacity:
+            push((level + 1, current_value + values[item], current_weight + weights[item], chosen | bit))
+    
+    return top_heap, nodes, stack[::-1]
+
+
+def split_roots(values, weights, capacity, order, depth, root=(0, 0, 0, 0)):
+    """Expand the first depth levels of the B&B tree breadth-first
+    
+    Applies the same branching rule as bnb_search (include only if it
+    fits) without bounding, starting at the root's level. Returns the
+    frontier nodes, include-first, and the number of nodes expanded to
+    build it.
+    """
+    frontier = [root] if root[2] <= capacity else []
+    expanded = 0
+    
+    for level in range(root[0], min(root[0] + depth, len(order))):
+        item = order[level]
+        bit = 1 << item
+        children = []
+        for _, current_value, current_weight, chosen in frontier:
+            expanded += 1
+            if current_weight + weights[item] <= capacity:
+                children.append((level + 1, current_value + values[item],
+                                 current_weight + weights[item], chosen | bit))
+            children.append((level + 1, current_value, current_weight, chosen))
+        frontier = children
+    
+    return frontier, expanded
+
+
+def _init_worker(shared_worst):
+    """Process pool initializer: remember the shared pruning threshold"""
+    global _shared_worst
+    _shared_worst = shared_worst
+
+
+def _search_subtree(args):
+    """Process pool task: run bnb_search below one frontier node"""
+    return bnb_search(*args, shared_worst=_shared_worst)
+
 
 class BranchBoundKnapsack(KnapsackEngine):
     """0/1 Knapsack solver using Branch & Bound"""
     
+    MEMO_LIMIT = 200_000  # Max cached (level, remaining capacity) bounds
+    # Nodes searched serially before going parallel. Most instances finish
+    # well inside it (in milliseconds), where a process pool would cost tens
+    # of milliseconds just to start; only searches still running fan out
+    PARALLEL_NODE_BUDGET = 50_000
+    SPLIT_DEPTH = 6  # Levels split below the shallowest unexplored node (<= 64 roots each)
+    
     def __init__(self):
         super().__init__()
         self.best_value = 0
         self.best_selection = []
         self.top_n = 1
         self.top_solutions = []
+        self._top_heap = []  # Min-heap of (value, tiebreak, chosen) during search
         self.nodes_explored = 0
+        self.order = []  # Free item indices sorted by value/weight ratio (best first)
+        self.root = (0, 0, 0, 0)  # Search root with all required items already picked
     
     def configure_problem(self):
         """Override to add top-N selection"""
@@ -33,116 +213,91 @@ class BranchBoundKnapsack(KnapsackEngine):
             except ValueError:
                 print("Invalid input!")
     
-    def calculate_upper_bound(self, level, current_value, current_weight, selection):
-        """Calculate upper bound using fractional relaxation"""
-        remaining_capacity = self.capacity - current_weight
-        bound = current_value
-        
-        # Get remaining items sorted by value/weight ratio
-        remaining = []
-        for i in range(level, self.num_items):
-            if i not in self.excluded_items and selection[i] == -1:
-                ratio = self.values[i] / self.weights[i] if self.weights[i] > 0 else 0
-                remaining.append((i, ratio, self.values[i], self.weights[i]))
-        
-        # Sort by ratio (greedy)
-        remaining.sort(key=lambda x: x[1], reverse=True)
-        
-        # Add items greedily (fractional allowed for bound)
-        for i, ratio, value, weight in remaining:
-            if weight <= remaining_capacity:
-                bound += value
-                remaining_capacity -= weight
-            else:
-                # Add fractional part
-                bound += ratio * remaining_capacity
-                break
+    def _sort_by_ratio(self):
+        """Free items in value/weight ratio order; B&B branches in this order
         
-        return bound
+        Filters the engine's cached ratio order instead of sorting again.
+        """
+        forced_mask = self.required_mask | self.excluded_mask
+        if not self.ratios:
+            self.compute_ratios()
+        self.order = [i for i in self.sorted_order if not forced_mask >> i & 1]
     
-    def is_feasible(self, selection):
-        """Check if selection is feasible"""
-        total_weight = sum(self.weights[i] for i in range(self.num_items) if selection[i] == 1)
-        
-        if total_weight > self.capacity:
-            return False
-        
-        # Check required items
-        for i in self.required_items:
-            if selection[i] != 1:
-                return False
+    def _fold_forced_items(self):
+        """Start the search with required items picked and excluded items dropped
         
-        # Check excluded items
-        for i in self.excluded_items:
-            if selection[i] == 1:
-                return False
-        
-        return True
+        Forced items never need branching, so the tree only spans the
+        2^(free items) choices left.
+        """
+        req_weight = sum(self.weights[i] for i in set(self.required_items))
+        req_value = sum(self.values[i] for i in set(self.required_items))
+        self.root = (0, req_value, req_weight, self.required_mask)
     
-    def branch_and_bound(self, selection, level, current_value, current_weight):
-        """Recursive Branch & Bound"""
-        self.nodes_explored += 1
-        
-        # Prune if over capacity
-        if current_weight > self.capacity:
-            return
+    def branch_and_bound(self):
+        """Run the Branch & Bound kernel on this problem
         
-        # Base case: all items considered
-        if level == self.num_items:
-            if self.is_feasible(selection):
-                solution_copy = selection[:]
-                total_val = sum(self.values[i] for i in range(self.num_items) if selection[i] == 1)
-                
-                # Add to top solutions
-                self.top_solutions.append((total_val, solution_copy))
-                self.top_solutions.sort(key=lambda x: x[0], reverse=True)
-                
-                if len(self.top_solutions) > self.top_n:
-                    self.top_solutions = self.top_solutions[:self.top_n]
-                
-                if self.top_solutions:
-                    self.best_value = self.top_solutions[0][0]
-                    self.best_selection = self.top_solutions[0][1]
-            return
+        The search runs serially first; only when it outgrows
+        PARALLEL_NODE_BUDGET on a multi-core machine are the subtrees it
+        has not reached farmed out to worker processes.
+        """
+        workers = os.cpu_count() or 1
+        budget = self.PARALLEL_NODE_BUDGET if workers > 1 else None
         
-        # Calculate upper bound
-        bound = self.calculate_upper_bound(level, current_value, current_weight, selection)
+        top_heap, self.nodes_explored, frontier = bnb_search(
+            self.values, self.weights, self.capacity, self.order,
+            self.top_n, self.MEMO_LIMIT, self.root, node_budget=budget)
+        self._top_heap = [(value, (0, tiebreak), chosen) for value, tiebreak, chosen in top_heap]
         
-        # Prune if bound <= worst in top-N
-        worst_in_top = self.top_solutions[-1][0] if len(self.top_solutions) == self.top_n else float('-inf')
-        if bound <= worst_in_top:
-            return
+        if frontier:
+            self._parallel_branch_and_bound(workers, frontier)
+    
+    def _parallel_branch_and_bound(self, workers, frontier):
+        """Search the unexplored subtrees in worker processes and merge top-N
         
-        # Check if this item is required/excluded
-        if level in self.required_items:
-            # Must include
-            selection[level] = 1
-            self.branch_and_bound(selection, level + 1,
-                                current_value + self.values[level],
-                                current_weight + self.weights[level])
-            selection[level] = -1
-            return
+        Workers share only a single pruning threshold, seeded from the
+        serial search's top-N, so no subtree ever waits on another.
+        """
+        # Process-pool machinery is only imported when a parallel search runs
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
         
-        if level in self.excluded_items:
-            # Must exclude
-            selection[level] = 0
-            self.branch_and_bound(selection, level + 1, current_value, current_weight)
-            selection[level] = -1
-            return
+        problem = (self.values, self.weights, self.capacity, self.order,
+                   self.top_n, self.MEMO_LIMIT)
         
-        # Try including item
-        if current_weight + self.weights[level] <= self.capacity:
-            selection[level] = 1
-            self.branch_and_bound(selection, level + 1,
-                                current_value + self.values[level],
-                                current_weight + self.weights[level])
+        # Subtrees shrink with depth, so shallow frontier nodes are split
+        # further than deep ones to even out the tasks
+        shallowest = min(node[0] for node in frontier)
+        roots = []
+        for node in frontier:
+            depth = max(self.SPLIT_DEPTH - (node[0] - shallowest), 0)
+            node_roots, expanded = split_roots(self.values, self.weights, self.capacity,
+                                               self.order, depth, node)
+            roots.extend(node_roots)
+            self.nodes_explored += expanded
         
-        # Try excluding item
-        selection[level] = 0
-        self.branch_and_bound(selection, level + 1, current_value, current_weight)
+        worst = self._top_heap[0][0] if len(self._top_heap) == self.top_n else float('-inf')
+        shared_worst = multiprocessing.Value('d', worst)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared_worst,)) as pool:
+            results = list(pool.map(_search_subtree, [problem + (root,) for root in roots]))
         
-        # Reset
-        selection[level] = -1
+        # Tag ties with the root index so merged order is deterministic; a
+        # greedy seed offered serially can turn up again as a worker's leaf
+        merged = self._top_heap + [(value, (root_idx, tiebreak), chosen)
+                                   for root_idx, (top_heap, _, _) in enumerate(results, 1)
+                                   for value, tiebreak, chosen in top_heap]
+        merged.sort(key=lambda e: (-e[0], e[1]))
+        seen = set()
+        self._top_heap = []
+        for entry in merged:
+            if entry[2] not in seen and len(self._top_heap) < self.top_n:
+                seen.add(entry[2])
+                self._top_heap.append(entry)
+        self.nodes_explored += sum(nodes for _, nodes, _ in results)
+    
+    def selection_vector(self, chosen):
+        """Expand a chosen-items bitmask into a 0/1 selection list"""
+        return [chosen >> i & 1 for i in range(self.num_items)]
     
     def solve(self):
         """Solve using Branch & Bound"""
@@ -153,8 +308,18 @@ class BranchBoundKnapsack(KnapsackEngine):
         print("\n→ Starting Branch & Bound search...")
         print(f"  Finding top {self.top_n} solution(s)")
         
-        initial_selection = [-1] * self.num_items
-        self.branch_and_bound(initial_selection, 0, 0, 0)
+        self.build_constraint_masks()
+        self._sort_by_ratio()
+        self._fold_forced_items()
+        self.branch_and_bound()
+        
+        # Best first; equal values keep the order they were found in
+        self.top_solutions = [(value, chosen) for value, _, chosen in
+                              sorted(self._top_heap, key=lambda e: (-e[0], e[1]))]
+        
+        if self.top_solutions:
+            self.best_value = self.top_solutions[0][0]
+            self.best_selection = self.selection_vector(self.top_solutions[0][1])
         
         print(f"\n✓ Search complete!")
         print(f"  Nodes explored: {self.nodes_explored}")
@@ -177,7 +342,8 @@ class BranchBoundKnapsack(KnapsackEngine):
             print("\nNo feasible solution found!")
             return
         
-        for rank, (value, selection) in enumerate(self.top_solutions, 1):
+        for rank, (value, chosen) in enumerate(self.top_solutions, 1):
+            selection = self.selection_vector(chosen)
             print("\n" + "-" * 60)
             if self.top_n > 1:
                 print(f"  SOLUTION #{rank}")
@@ -225,7 +391,8 @@ class BranchBoundKnapsack(KnapsackEngine):
             print(f"\n  {'Rank':<6}{'Value':<12}{'Weight':<12}{'Selection':<30}")
             print("  " + "-" * 60)
             
-            for rank, (value, selection) in enumerate(self.top_solutions, 1):
+            for rank, (value, chosen) in enumerate(self.top_solutions, 1):
+                selection = self.selection_vector(chosen)
                 sel_str = "[" + ", ".join(str(max(0, s)) for s in selection) + "]"
                 weight = sum(self.weights[i] for i in range(self.num_items) if selection[i] == 1)
                 print(f"  {rank:<6}{value:<12.2f}{weight:<12}{sel_str:<30}")
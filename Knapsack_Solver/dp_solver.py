@@ -4,106 +4,236 @@ Dynamic Programming Solver for 0/1 Knapsack
 Implements DP with step-by-step visualization and backtracking.
 """
 
+from functools import lru_cache
+from operator import ne
+
 from knapsack_core import KnapsackEngine
 
+# Maps the 0/1 bytes of a per-capacity flag row to ASCII digits for int(..., 2)
+_BIT_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _next_row(prev, weight, value, capacity, is_skipped, floor=0):
+    """Build DP row i from row i-1 using slice operations (no per-cell loop)
+    
+    Only capacities >= floor are updated; cells below it are copied as-is.
+    """
+    start = max(weight, floor)
+    if is_skipped or start > capacity:
+        # Can't include at any capacity
+        return prev[:]
+    
+    # Single fused pass: compare exclude (prev[w]) with include (value + prev[w-weight])
+    # without building an intermediate include row; ties keep the exclude value
+    return prev[:start] + [skip if skip >= (take := value + p) else take
+                           for skip, p in zip(prev[start:], prev[start - weight:])]
+
+
+def _advance(row, weight, value, capacity, is_skipped, floor=0):
+    """Roll the DP row forward by one item.
+    
+    Returns (new_row, keep) where keep is an int bitset: bit w is set iff
+    the item changed dp[w], i.e. the item is taken when backtracking
+    through capacity w. Packing costs one bit per capacity.
+    """
+    new_row = _next_row(row, weight, value, capacity, is_skipped, floor)
+    start = max(weight, floor)
+    changed = bytearray(map(ne, new_row[start:], row[start:]))
+    if not changed:
+        return new_row, 0
+    return new_row, int(changed.translate(_BIT_DIGITS)[::-1], 2) << start
+
+
+def live_floors(weights, capacity, skip_mask):
+    """Lowest capacity each item's DP update still has to cover
+    
+    Backtracking starts at dp[capacity] and each later item can take at
+    most its own weight off it, so item i is only ever queried at
+    capacities >= capacity - (weight of the free items after i). Later
+    rows only read cells in that window too, so everything below it is
+    dead work; for small items and a large W this skips most of the row.
+    """
+    floors = [0] * len(weights)
+    later = 0
+    for i in range(len(weights) - 1, -1, -1):
+        floors[i] = max(capacity - later, 0)
+        if not skip_mask >> i & 1:
+            later += weights[i]
+    return floors
+
+
+def fill_dp_table(weights, values, capacity, skip_mask):
+    """Run the DP fill without any display (fast path).
+    
+    Items whose bit is set in skip_mask (excluded, or required and already
+    reserved) take no part. Each item only updates its live capacity
+    window (see live_floors), so only row[capacity] is meaningful at the
+    end. Only the last row is kept (O(W) values);
+    backtracking uses one bit-per-capacity keep bitset per item instead
+    of the full value table.
+    """
+    row = [0] * (capacity + 1)
+    keep = []
+    floors = live_floors(weights, capacity, skip_mask)
+    for i in range(len(weights)):
+        row, kept = _advance(row, weights[i], values[i], capacity, skip_mask >> i & 1, floors[i])
+        keep.append(kept)
+    return row, keep
+
+
+@lru_cache(maxsize=4)
+def fill_dp_table_cached(weights, values, capacity, skip_mask):
+    """Memoized fill_dp_table for tuple inputs
+    
+    Re-solving the same problem (e.g. comparing methods) returns at once.
+    Returns (best_value, keep): only row[capacity] is meaningful after the
+    live-floor fill, so the O(W) row itself is not retained by the cache.
+    keep is a tuple of int bitsets since it is shared. Each entry still
+    holds n*W bits, so only a few small tables are kept (see CACHE_MAX_CELLS).
+    """
+    row, keep = fill_dp_table(weights, values, capacity, skip_mask)
+    return row[capacity], tuple(keep)
+
 
 class DPKnapsackSolver(KnapsackEngine):
     """0/1 Knapsack solver using Dynamic Programming"""
     
+    MAX_CAPACITY = 10_000_000  # Largest DP row worth allocating
+    MAX_CELLS = 10 ** 8  # Largest items x capacity table worth filling
+    CACHE_MAX_CELLS = 10 ** 7  # Largest table memoized (~1.25 MB of keep bits)
+    
+    @classmethod
+    def is_tractable(cls, num_items, capacity):
+        """True when the O(n*W) table is small enough to fill"""
+        return capacity <= cls.MAX_CAPACITY and num_items * capacity <= cls.MAX_CELLS
+    
     def __init__(self):
         super().__init__()
-        self.dp_table = []
-        self.selected_items = []
+        self.dp_row = []  # Last DP row; only the step-by-step fill keeps it
+        self.keep = []
+        self.free_capacity = 0  # Capacity left after reserving required items
     
     def solve(self, show_steps=True):
-        """Solve knapsack using DP"""
+        """Solve knapsack using DP
+        
+        Required items are reserved up front: their weight is taken off the
+        capacity and the DP only chooses among the free items.
+        """
         print("\n" + "=" * 70)
         print("      SOLVING 0/1 KNAPSACK USING DYNAMIC PROGRAMMING")
         print("="*70)
         
         n = self.num_items
-        W = self.capacity
         
         # Check required items feasibility
-        req_weight = sum([self.weights[i] for i in self.required_items])
-        req_value = sum([self.values[i] for i in self.required_items])
+        req_weight = sum([self.weights[i] for i in set(self.required_items)])
+        req_value = sum([self.values[i] for i in set(self.required_items)])
         
-        if req_weight > W:
-            print(f"\n✗ ERROR: Required items (weight={req_weight}) exceed capacity ({W})!")
+        if req_weight > self.capacity:
+            print(f"\n✗ ERROR: Required items (weight={req_weight}) exceed capacity ({self.capacity})!")
             return False
         
-        # Initialize DP table
-        self.dp_table = [[0 for _ in range(W + 1)] for _ in range(n + 1)]
+        self.build_constraint_masks()
+        self.free_capacity = W = self.capacity - req_weight
+        
+        if not show_steps:
+            # Numeric core only: no table walkthrough, no backtracking trace
+            best_value, self.selected_items = self._solve_fast()
+            print(f"\n  >>> MAXIMUM VALUE = {best_value}")
+            self.display_solution()
+            return True
+        
+        if req_weight:
+            print(f"\nReserved for required items: weight {req_weight}, value {req_value}")
+            print(f"Capacity left for the DP: {self.capacity} - {req_weight} = {W}")
         
         print("\n" + "-" * 70)
         print(f"Table dimensions: ({n+1}) rows × ({W+1}) columns")
         print(f"dp[i][w] = Maximum value using items 0..i-1 with capacity w")
         print("-" * 70)
         
-        if show_steps:
-            input("\nPress ENTER to see step-by-step DP table filling...")
+        self._fill_with_steps()
+        
+        print(f"\n{'='*70}")
+        if req_weight:
+            print(f"  >>> MAXIMUM VALUE = dp[{n}][{W}] + {req_value} = {self.dp_row[W] + req_value}")
+        else:
+            print(f"  >>> MAXIMUM VALUE = dp[{n}][{W}] = {self.dp_row[W]}")
+        print("="*70)
+        
+        # Backtrack
+        self._backtrack(show_steps)
+        
+        # Display solution
+        self.display_solution()
+        
+        return True
+    
+    def _solve_fast(self):
+        """Fill and backtrack without any I/O; returns (best_value, selected_items)"""
+        skip_mask = self.excluded_mask | self.required_mask
+        if self.num_items * self.free_capacity <= self.CACHE_MAX_CELLS:
+            best_free, self.keep = fill_dp_table_cached(tuple(self.weights), tuple(self.values),
+                                                        self.free_capacity, skip_mask)
+        else:
+            # Too big to keep around after this solve
+            row, self.keep = fill_dp_table(self.weights, self.values, self.free_capacity, skip_mask)
+            best_free = row[self.free_capacity]
+        req_value = sum(self.values[i] for i in set(self.required_items))
+        return best_free + req_value, self._selected_from_keep()
+    
+    def _selected_from_keep(self):
+        """Walk the keep tables back from the free capacity; add required items"""
+        w = self.free_capacity
+        selected = []
+        for i in range(self.num_items - 1, -1, -1):
+            if self.required_mask >> i & 1:
+                selected.append(i)
+            elif self.keep[i] >> w & 1:
+                selected.append(i)
+                w -= self.weights[i]
+        selected.reverse()
+        return selected
+    
+    def _fill_with_steps(self):
+        """Fill the DP table item by item, explaining each decision"""
+        n = self.num_items
+        W = self.free_capacity
+        self.dp_row = [0] * (W + 1)
+        self.keep = []
+        floors = live_floors(self.weights, W, self.excluded_mask | self.required_mask)
+        
+        input("\nPress ENTER to see step-by-step DP table filling...")
         
-        # Fill DP table
         for i in range(1, n + 1):
             item_idx = i - 1
             
-            if show_steps:
-                print(f"\n{'='*70}")
-                print(f"  PROCESSING ITEM {i}: {self.item_names[item_idx]}")
-                print(f"  Weight = {self.weights[item_idx]}, Value = {self.values[item_idx]}")
+            print(f"\n{'='*70}")
+            print(f"  PROCESSING ITEM {i}: {self.item_names[item_idx]}")
+            print(f"  Weight = {self.weights[item_idx]}, Value = {self.values[item_idx]}")
             
-            is_excluded = item_idx in self.excluded_items
-            is_required = item_idx in self.required_items
+            is_excluded = self.excluded_mask >> item_idx & 1
+            is_required = self.required_mask >> item_idx & 1
             
             if is_excluded:
-                if show_steps:
-                    print("  *** EXCLUDED - Skipping ***")
-                for w in range(W + 1):
-                    self.dp_table[i][w] = self.dp_table[i-1][w]
-                continue
-            
-            if is_required and show_steps:
-                print("  *** REQUIRED - Must include ***")
+                print("  *** EXCLUDED - Skipping ***")
+            elif is_required:
+                print("  *** REQUIRED - Already reserved, skipping ***")
             
-            # Fill for each capacity
-            for w in range(W + 1):
-                if self.weights[item_idx] > w:
-                    # Can't include
-                    self.dp_table[i][w] = self.dp_table[i-1][w]
-                else:
-                    # Can include
-                    exclude_value = self.dp_table[i-1][w]
-                    include_value = self.values[item_idx] + self.dp_table[i-1][w - self.weights[item_idx]]
-                    
-                    if is_required:
-                        self.dp_table[i][w] = include_value
-                    else:
-                        self.dp_table[i][w] = max(exclude_value, include_value)
+            prev = self.dp_row
+            self.dp_row, kept = _advance(prev, self.weights[item_idx], self.values[item_idx],
+                                         W, is_excluded or is_required, floors[item_idx])
+            self.keep.append(kept)
             
-            if show_steps and self.weights[item_idx] <= W:
-                exclude_val = self.dp_table[i-1][W]
-                include_val = self.values[item_idx] + self.dp_table[i-1][W - self.weights[item_idx]]
+            if not (is_excluded or is_required) and self.weights[item_idx] <= W:
+                exclude_val = prev[W]
+                include_val = self.values[item_idx] + prev[W - self.weights[item_idx]]
                 print(f"\n  At capacity w={W}:")
-                if is_required:
-                    print(f"    MUST INCLUDE: {include_val}")
-                else:
-                    print(f"    Exclude: {exclude_val} vs Include: {include_val}")
-                    print(f"    Decision: {'INCLUDE' if self.dp_table[i][W] == include_val else 'EXCLUDE'}")
+                print(f"    Exclude: {exclude_val} vs Include: {include_val}")
+                print(f"    Decision: {'INCLUDE' if self.dp_row[W] == include_val else 'EXCLUDE'}")
                 
                 if i < n:
                     input(f"  Press ENTER to process next item...")
-        
-        print(f"\n{'='*70}")
-        print(f"  >>> MAXIMUM VALUE = dp[{n}][{W}] = {self.dp_table[n][W]}")
-        print("="*70)
-        
-        # Backtrack
-        self._backtrack(show_steps)
-        
-        # Display solution
-        self.display_solution()
-        
-        return True
     
     def _backtrack(self, show_steps=True):
         """Backtrack to find selected items"""
@@ -112,15 +242,19 @@ class DPKnapsackSolver(KnapsackEngine):
         print("=" * 70)
         
         n = self.num_items
-        w = self.capacity
+        w = self.free_capacity
         self.selected_items = []
         
         if show_steps:
-            print(f"\nStarting from dp[{n}][{w}] = {self.dp_table[n][w]}")
+            print(f"\nStarting from dp[{n}][{w}] = {self.dp_row[w]}")
             print("\nBacktracking path:")
         
         for i in range(n, 0, -1):
-            if self.dp_table[i][w] != self.dp_table[i-1][w]:
+            if self.required_mask >> (i-1) & 1:
+                self.selected_items.insert(0, i-1)
+                if show_steps:
+                    print(f"  {self.item_names[i-1]} is REQUIRED => INCLUDED (capacity reserved)")
+            elif self.keep[i-1] >> w & 1:
                 self.selected_items.insert(0, i-1)
                 if show_steps:
                     print(f"  dp[{i}][{w}] ≠ dp[{i-1}][{w}] => {self.item_names[i-1]} INCLUDED")
@@ -129,48 +263,3 @@ class DPKnapsackSolver(KnapsackEngine):
             else:
                 if show_steps:
                     print(f"  dp[{i}][{w}] == dp[{i-1}][{w}] => {self.item_names[i-1]} NOT included")
-    
-    def display_solution(self):
-        """Display optimal solution"""
-        print("\n" + "=" * 60)
-        print("                OPTIMAL SOLUTION")
-        print("=" * 60)
-        
-        total_weight = 0
-        total_value = 0
-        
-        print("\nSelected Items:")
-        print("-" * 50)
-        print(f"{'Item':<20}{'Weight':<10}{'Value':<10}")
-        print("-" * 50)
-        
-        for idx in self.selected_items:
-            print(f"{self.item_names[idx]:<20}{self.weights[idx]:<10}{self.values[idx]:<10.2f}")
-            total_weight += self.weights[idx]
-            total_value += self.values[idx]
-        
-        print("-" * 50)
-        print(f"{'TOTAL':<20}{total_weight:<10}{total_value:<10.2f}")
-        print("-" * 50)
-        
-        print(f"\nKnapsack Capacity Used: {total_weight} / {self.capacity}")
-        print(f"Remaining Capacity: {self.capacity - total_weight}")
-        print(f"\nMaximum Value Achieved: {total_value:.2f}")
-        
-        # Visual representation
-        print("\n" + "-" * 50)
-        print("KNAPSACK VISUALIZATION")
-        print("-" * 50)
-        
-        filled = int((total_weight / self.capacity) * 30)
-        empty = 30 - filled
-        
-        print(f"\n  [{'#' * filled}{'.' * empty}]")
-        print(f"  Capacity: {total_weight}/{self.capacity} ({(total_weight/self.capacity*100):.1f}% full)")
-        
-        # Items not selected
-        not_selected = [i for i in range(self.num_items) if i not in self.selected_items]
-        if not_selected:
-            print("\n  Items NOT selected:")
-            for idx in not_selected:
-                print(f"  x {self.item_names[idx]} (w={self.weights[idx]}, v={self.values[idx]})")
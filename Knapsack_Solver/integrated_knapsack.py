@@ -4,11 +4,42 @@ Integrated 0/1 Knapsack Solver
 Main interface for knapsack solving with DP and Branch & Bound.
 """
 
+import sys
+from enum import Enum
+
 from dp_solver import DPKnapsackSolver
 from branch_bound_knapsack import BranchBoundKnapsack
+from mitm_solver import MeetInTheMiddleKnapsack
+
+
+class Strategy(Enum):
+    """Exact method used for an optimal (single-solution) knapsack run"""
+    DYNAMIC_PROGRAMMING = "Dynamic Programming"
+    MEET_IN_THE_MIDDLE = "Meet-in-the-Middle"
+    BRANCH_AND_BOUND = "Branch & Bound"
 
-def solve_knapsack_problem():
-    """Solve a knapsack problem"""
+
+def _choose_strategy(engine, show_steps=False):
+    """Pick the fastest exact method for the configured problem size
+    
+    DP costs O(n*W) and MITM O(2^(n/2)), so few items with a large
+    capacity go to MITM; a capacity too large for DP with too many items
+    for MITM falls back to Branch & Bound. The DP walkthrough is kept
+    whenever step-by-step output is asked for and the table fits.
+    """
+    n, W = engine.num_items, engine.capacity
+    if not DPKnapsackSolver.is_tractable(n, W):
+        if n <= MeetInTheMiddleKnapsack.MAX_ITEMS:
+            return Strategy.MEET_IN_THE_MIDDLE
+        return Strategy.BRANCH_AND_BOUND
+    if not show_steps and n <= MeetInTheMiddleKnapsack.MAX_ITEMS \
+            and MeetInTheMiddleKnapsack.is_cheaper_than_dp(n, W):
+        return Strategy.MEET_IN_THE_MIDDLE
+    return Strategy.DYNAMIC_PROGRAMMING
+
+
+def solve_knapsack_problem(show_steps=False):
+    """Solve a knapsack problem (show_steps enables the DP teaching walkthrough)"""
     print("\n" + "-" * 70)
     print("         0/1 KNAPSACK PROBLEM")
     print("-" * 70)
@@ -30,8 +61,21 @@ def solve_knapsack_problem():
     if method == 1:
         solver = DPKnapsackSolver()
         solver.configure_problem()
+        
+        strategy = _choose_strategy(solver, show_steps)
+        if strategy is not Strategy.DYNAMIC_PROGRAMMING:
+            # DP table would be too large or slower - switch to a capacity-independent method
+            print(f"\n→ A DP table is not the best fit for this capacity; using {strategy.value} instead.")
+            fallback = (MeetInTheMiddleKnapsack() if strategy is Strategy.MEET_IN_THE_MIDDLE
+                        else BranchBoundKnapsack())
+            fallback.copy_problem_from(solver)
+            solver = fallback
+            input("\n→ Press ENTER to start solving...")
+            solver.solve()
+            return solver
+        
         input("\n→ Press ENTER to start solving...")
-        solver.solve(show_steps=True)
+        solver.solve(show_steps=show_steps)
     else:
         solver = BranchBoundKnapsack()
         solver.configure_problem()
@@ -40,7 +84,7 @@ def solve_knapsack_problem():
     
     return solver
 
-def main():
+def main(show_steps=False):
     """Main application loop"""
     print("\n" + "=" * 70)
     print("|" + " " * 15 + "KNAPSACK SOLVER SUITE" + " " * 31 + "|")
@@ -63,7 +107,7 @@ def main():
                 print("Invalid input!")
         
         if choice == 1:
-            solve_knapsack_problem()
+            solve_knapsack_problem(show_steps)
         elif choice == 2:
             print("\n" + "=" * 70)
             print("Thank you for using Knapsack Solver!")
@@ -79,4 +123,5 @@ def main():
             break
 
 if __name__ == "__main__":
-    main()
+    # Pass --verbose for the step-by-step DP walkthrough (teaching mode)
+    main(show_steps="--verbose" in sys.argv)
@@ -4,6 +4,19 @@
 Base class for knapsack solving with input and constraints.
 """
 
+import sys
+from operator import index
+
+
+def _is_integer(number):
+    """True for int-like numbers (int, bool, numpy ints); False for floats"""
+    try:
+        index(number)
+    except TypeError:
+        return False
+    return True
+
+
 class KnapsackEngine:
     """Base engine for 0/1 Knapsack problem"""
     
@@ -13,8 +26,15 @@ class KnapsackEngine:
         self.weights = []
         self.values = []
         self.item_names = []
+        self.ratios = []  # value/weight per item, cached by compute_ratios()
+        self.sorted_order = []  # Item indices by ratio, best first (cached with ratios)
         self.excluded_items = []  # Items to NOT pick
         self.required_items = []  # Items to MUST pick
+        self.excluded_set = set()  # Same items as excluded_items, for O(1) membership tests
+        self.required_set = set()  # Same items as required_items, for O(1) membership tests
+        self.excluded_mask = 0  # Bit i set when item i is excluded
+        self.required_mask = 0  # Bit i set when item i is required
+        self.selected_items = []  # Indices picked by a single-solution solver
         
     def configure_problem(self):
         """Get problem input from user"""
@@ -43,6 +63,12 @@ class KnapsackEngine:
             except ValueError:
                 print("Invalid input!")
         
+        # Item data is stored column-wise (one flat list per attribute), sized
+        # up front; the solver kernels take these parallel sequences as-is
+        self.item_names = [""] * self.num_items
+        self.weights = [0] * self.num_items
+        self.values = [0.0] * self.num_items
+        
         # Get item details
         print("\n--- ITEM DETAILS ---")
         for i in range(self.num_items):
@@ -52,14 +78,14 @@ class KnapsackEngine:
             name = input(f"  Item name (or press Enter for 'Item {i+1}'): ").strip()
             if not name:
                 name = f"Item {i+1}"
-            self.item_names.append(name)
+            self.item_names[i] = name
             
             # Weight
             while True:
                 try:
                     weight = int(input(f"  Weight of {name}: "))
                     if weight > 0:
-                        self.weights.append(weight)
+                        self.weights[i] = weight
                         break
                     print("  Weight must be positive")
                 except ValueError:
@@ -70,7 +96,7 @@ class KnapsackEngine:
                 try:
                     value = float(input(f"  Value of {name}: "))
                     if value >= 0:
-                        self.values.append(value)
+                        self.values[i] = value
                         break
                     print("  Value must be non-negative")
                 except ValueError:
@@ -78,8 +104,50 @@ class KnapsackEngine:
         
         # Constraints
         self._get_constraints()
+        self._validate()
+        self.compute_ratios()
         self.display_problem()
     
+    def configure_from_arrays(self, weights, values, capacity, names=None, excluded=(), required=()):
+        """Set up a problem directly from sequences (no prompts, no display)
+        
+        Items are 0-based in excluded/required. Raises ValueError on bad
+        input instead of asking again, for scripted and batch runs.
+        """
+        self.num_items = len(weights)
+        self.capacity = capacity
+        self.weights = list(weights)
+        self.values = list(values)
+        self.item_names = list(names) if names is not None else [f"Item {i+1}" for i in range(self.num_items)]
+        self.excluded_items = list(excluded)
+        self.required_items = list(required)
+        self.excluded_set = set(self.excluded_items)
+        self.required_set = set(self.required_items)
+        self._validate()
+        self.compute_ratios()
+    
+    def _validate(self):
+        """Check the configured problem; raises ValueError on the first problem found"""
+        if self.num_items <= 0:
+            raise ValueError("Number of items must be positive")
+        # The DP indexes rows by capacity, so weights and capacity must be integers
+        if not _is_integer(self.capacity):
+            raise ValueError("Capacity must be an integer")
+        if self.capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not len(self.weights) == len(self.values) == len(self.item_names) == self.num_items:
+            raise ValueError("Weights, values and names must have one entry per item")
+        if not all(map(_is_integer, self.weights)):
+            raise ValueError("Weight must be an integer")
+        if any(w <= 0 for w in self.weights):
+            raise ValueError("Weight must be positive")
+        if any(v < 0 for v in self.values):
+            raise ValueError("Value must be non-negative")
+        if any(not 0 <= i < self.num_items for i in self.excluded_set | self.required_set):
+            raise ValueError("Constrained item index out of range")
+        if self.excluded_set & self.required_set:
+            raise ValueError("An item cannot be both excluded and required")
+    
     def _get_constraints(self):
         """Get item selection constraints"""
         print("\n" + "-" * 60)
@@ -100,6 +168,7 @@ class KnapsackEngine:
                         num = int(num_str.strip())
                         if 1 <= num <= self.num_items:
                             self.excluded_items.append(num - 1)
+                            self.excluded_set.add(num - 1)
                             print(f"  X {self.item_names[num-1]} will be EXCLUDED")
                     except:
                         pass
@@ -109,7 +178,7 @@ class KnapsackEngine:
         if require:
             print("\nAvailable items (not excluded):")
             for i in range(self.num_items):
-                if i not in self.excluded_items:
+                if i not in self.excluded_set:
                     print(f"  {i+1}. {self.item_names[i]} (w={self.weights[i]}, v={self.values[i]})")
             
             require_input = input("Enter item numbers to REQUIRE (comma-separated): ").strip()
@@ -117,46 +186,121 @@ class KnapsackEngine:
                 for num_str in require_input.split(','):
                     try:
                         num = int(num_str.strip())
-                        if 1 <= num <= self.num_items and (num-1) not in self.excluded_items:
+                        if 1 <= num <= self.num_items and (num-1) not in self.excluded_set:
                             self.required_items.append(num - 1)
+                            self.required_set.add(num - 1)
                             print(f"  + {self.item_names[num-1]} will be REQUIRED")
                     except:
                         pass
     
+    def copy_problem_from(self, other):
+        """Take over the problem configured on another engine"""
+        self.num_items = other.num_items
+        self.capacity = other.capacity
+        self.weights = list(other.weights)
+        self.values = list(other.values)
+        self.item_names = list(other.item_names)
+        self.excluded_items = list(other.excluded_items)
+        self.required_items = list(other.required_items)
+        self.excluded_set = set(other.excluded_items)
+        self.required_set = set(other.required_items)
+        self.ratios = list(other.ratios)
+        self.sorted_order = list(other.sorted_order)
+    
+    def compute_ratios(self):
+        """Compute the value/weight ratio of every item once and cache it
+        
+        The ratio order does not depend on capacity or constraints, so it
+        is sorted here once (stable: ties keep item order) and reused.
+        """
+        self.ratios = [v / w if w > 0 else 0 for v, w in zip(self.values, self.weights)]
+        self.sorted_order = sorted(range(self.num_items), key=self.ratios.__getitem__, reverse=True)
+        return self.ratios
+    
+    def build_constraint_masks(self):
+        """Encode excluded/required items as bitmasks for the solvers' hot loops"""
+        self.excluded_mask = sum(1 << i for i in set(self.excluded_items))
+        self.required_mask = sum(1 << i for i in set(self.required_items))
+    
     def display_problem(self):
         """Display problem summary"""
-        print("\n" + "=" * 70)
-        print("                 KNAPSACK PROBLEM")
-        print("=" * 70)
+        lines = ["\n" + "=" * 70, "                 KNAPSACK PROBLEM", "=" * 70]
         
-        print(f"\nKnapsack Capacity: {self.capacity}")
-        print(f"Number of Items: {self.num_items}")
+        lines.append(f"\nKnapsack Capacity: {self.capacity}")
+        lines.append(f"Number of Items: {self.num_items}")
         
         # Show constraints
         if self.excluded_items or self.required_items:
-            print("\n" + "-" * 50)
-            print("USER-DEFINED CONSTRAINTS:")
+            lines.append("\n" + "-" * 50)
+            lines.append("USER-DEFINED CONSTRAINTS:")
             if self.excluded_items:
-                print(f"  X EXCLUDED: {', '.join([self.item_names[i] for i in self.excluded_items])}")
+                lines.append(f"  X EXCLUDED: {', '.join([self.item_names[i] for i in self.excluded_items])}")
             if self.required_items:
-                print(f"  + REQUIRED: {', '.join([self.item_names[i] for i in self.required_items])}")
+                lines.append(f"  + REQUIRED: {', '.join([self.item_names[i] for i in self.required_items])}")
         
         # Item table
-        print("\n" + "-" * 60)
-        print(f"{'Item':<15}{'Weight':<10}{'Value':<10}{'Ratio':<10}{'Constraint':<15}")
-        print("-" * 60)
+        lines.append("\n" + "-" * 60)
+        lines.append(f"{'Item':<15}{'Weight':<10}{'Value':<10}{'Ratio':<10}{'Constraint':<15}")
+        lines.append("-" * 60)
         
-        for i in range(self.num_items):
-            ratio = self.values[i] / self.weights[i]
-            
-            if i in self.excluded_items:
+        rows = zip(self.item_names, self.weights, self.values, self.ratios or self.compute_ratios())
+        for i, (name, weight, value, ratio) in enumerate(rows):
+            if i in self.excluded_set:
                 constraint = "EXCLUDED X"
-            elif i in self.required_items:
+            elif i in self.required_set:
                 constraint = "REQUIRED +"
             else:
                 constraint = "Optional"
             
-            print(f"{self.item_names[i]:<15}{self.weights[i]:<10}{self.values[i]:<10.2f}"
-                  f"{ratio:<10.2f}{constraint:<15}")
+            lines.append(f"{name:<15}{weight:<10}{value:<10.2f}{ratio:<10.2f}{constraint:<15}")
        
-        print("-" * 60)
+        lines.append("-" * 60)
+        
+        # One buffered write: large item tables cost a single syscall, not one per row
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def display_solution(self):
+        """Display the optimal solution given by self.selected_items"""
+        print("\n" + "=" * 60)
+        print("                OPTIMAL SOLUTION")
+        print("=" * 60)
+        
+        total_weight = 0
+        total_value = 0
+        
+        print("\nSelected Items:")
+        print("-" * 50)
+        print(f"{'Item':<20}{'Weight':<10}{'Value':<10}")
+        print("-" * 50)
+        
+        for idx in self.selected_items:
+            print(f"{self.item_names[idx]:<20}{self.weights[idx]:<10}{self.values[idx]:<10.2f}")
+            total_weight += self.weights[idx]
+            total_value += self.values[idx]
+        
+        print("-" * 50)
+        print(f"{'TOTAL':<20}{total_weight:<10}{total_value:<10.2f}")
+        print("-" * 50)
+        
+        print(f"\nKnapsack Capacity Used: {total_weight} / {self.capacity}")
+        print(f"Remaining Capacity: {self.capacity - total_weight}")
+        print(f"\nMaximum Value Achieved: {total_value:.2f}")
+        
+        # Visual representation
+        print("\n" + "-" * 50)
+        print("KNAPSACK VISUALIZATION")
+        print("-" * 50)
+        
+        filled = int((total_weight / self.capacity) * 30)
+        empty = 30 - filled
+        
+        print(f"\n  [{'#' * filled}{'.' * empty}]")
+        print(f"  Capacity: {total_weight}/{self.capacity} ({(total_weight/self.capacity*100):.1f}% full)")
+        
+        # Items not selected
+        selected = set(self.selected_items)
+        not_selected = [i for i in range(self.num_items) if i not in selected]
+        if not_selected:
+            print("\n  Items NOT selected:")
+            for idx in not_selected:
+                print(f"  x {self.item_names[idx]} (w={self.weights[idx]}, v={self.values[idx]})")
@@ -0,0 +1,111 @@
+"""
+Meet-in-the-Middle Solver for 0/1 Knapsack
+===========================================
+Exact solver for medium item counts with very large capacities, where
+the O(n*W) DP table is too big and Branch & Bound bounds are too loose.
+"""
+
+from bisect import bisect_right
+
+from knapsack_core import KnapsackEngine
+
+
+def enumerate_subsets(items, weights, values, capacity, required_mask, excluded_mask):
+    """List (weight, value, mask) for every feasible subset of items
+    
+    Required items are always taken, excluded items never, and subsets
+    over capacity are dropped as soon as they appear.
+    """
+    subsets = [(0, 0, 0)]
+    for i in items:
+        bit = 1 << i
+        if excluded_mask & bit:
+            continue
+        
+        taken = [(w + weights[i], v + values[i], m | bit)
+                 for w, v, m in subsets if w + weights[i] <= capacity]
+        subsets = taken if required_mask & bit else subsets + taken
+    return subsets
+
+
+def pareto_frontier(subsets):
+    """Sort subsets by weight and keep the best value seen up to each weight
+    
+    Returns (weights, best_values, best_masks) as parallel lists, where
+    best_values[k] is the most value achievable with weight <= weights[k].
+    """
+    frontier_weights, best_values, best_masks = [], [], []
+    best_value, best_mask = float('-inf'), 0
+    
+    for w, v, m in sorted(subsets):
+        if v > best_value:
+            best_value, best_mask = v, m
+        frontier_weights.append(w)
+        best_values.append(best_value)
+        best_masks.append(best_mask)
+    return frontier_weights, best_values, best_masks
+
+
+def meet_in_the_middle(weights, values, capacity, required_mask, excluded_mask):
+    """Solve 0/1 knapsack by splitting items into two halves
+    
+    Time is O(2^(n/2) * log 2^(n/2)) regardless of capacity. Returns
+    (best_value, chosen_mask), or (None, 0) when no subset is feasible.
+    """
+    n = len(weights)
+    half = n // 2
+    first = enumerate_subsets(range(half), weights, values, capacity, required_mask, excluded_mask)
+    second = enumerate_subsets(range(half, n), weights, values, capacity, required_mask, excluded_mask)
+    
+    frontier_weights, best_values, best_masks = pareto_frontier(first)
+    
+    best_value, chosen = None, 0
+    for w, v, m in second:
+        k = bisect_right(frontier_weights, capacity - w) - 1
+        if k < 0:
+            continue
+        total = v + best_values[k]
+        if best_value is None or total > best_value:
+            best_value, chosen = total, m | best_masks[k]
+    return best_value, chosen
+
+
+class MeetInTheMiddleKnapsack(KnapsackEngine):
+    """0/1 Knapsack solver using Meet-in-the-Middle (Horowitz-Sahni split)"""
+    
+    MAX_ITEMS = 40  # 2^20 subsets per half is the practical limit
+    SUBSET_COST = 8  # One enumerated subset costs about this many DP cells
+    
+    @classmethod
+    def is_cheaper_than_dp(cls, num_items, capacity):
+        """True when enumerating both halves costs less than filling the DP table"""
+        subsets = 2 ** (num_items // 2) + 2 ** (num_items - num_items // 2)
+        return cls.SUBSET_COST * subsets < num_items * capacity
+    
+    def solve(self):
+        """Solve using Meet-in-the-Middle"""
+        print("\n" + "=" * 70)
+        print("      SOLVING 0/1 KNAPSACK USING MEET-IN-THE-MIDDLE")
+        print("=" * 70)
+        
+        half = self.num_items // 2
+        print(f"\n→ Splitting {self.num_items} items into halves of {half} and {self.num_items - half}")
+        print(f"  Enumerating at most {2 ** half} + {2 ** (self.num_items - half)} subsets")
+        
+        self.build_constraint_masks()
+        best_value, chosen = meet_in_the_middle(self.weights, self.values, self.capacity,
+                                                self.required_mask, self.excluded_mask)
+        
+        if best_value is None:
+            print("\n✗ ERROR: No feasible selection satisfies the item constraints!")
+            return False
+        
+        self.selected_items = [i for i in range(self.num_items) if chosen >> i & 1]
+        
+        print(f"\n{'='*70}")
+        print(f"  >>> MAXIMUM VALUE = {best_value}")
+        print("="*70)
+        
+        self.display_solution()
+        
+        return True
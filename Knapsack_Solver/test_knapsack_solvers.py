@@ -0,0 +1,178 @@
+"""
+Tests for the 0/1 Knapsack solvers
+DP (fast and step-by-step), Branch & Bound top-N and Meet-in-the-Middle
+checked against brute force, plus the method dispatch
+"""
+
+import builtins
+import contextlib
+import io
+import random
+
+from branch_bound_knapsack import BranchBoundKnapsack
+from dp_solver import DPKnapsackSolver
+from integrated_knapsack import Strategy, _choose_strategy
+from mitm_solver import MeetInTheMiddleKnapsack
+
+
+@contextlib.contextmanager
+def quiet_session():
+    """Capture solver output and answer every ENTER prompt"""
+    original_input = builtins.input
+    builtins.input = lambda *args: ""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = original_input
+
+
+def brute_force(weights, values, capacity, required=(), excluded=()):
+    """Values of every feasible selection, best first"""
+    totals = []
+    for mask in range(1 << len(weights)):
+        if any(not mask >> i & 1 for i in required) or any(mask >> i & 1 for i in excluded):
+            continue
+        chosen = [i for i in range(len(weights)) if mask >> i & 1]
+        if sum(weights[i] for i in chosen) <= capacity:
+            totals.append(sum(values[i] for i in chosen))
+    return sorted(totals, reverse=True)
+
+
+def random_problem(rng):
+    """A small instance with random required/excluded items (may be infeasible)"""
+    n = rng.randint(1, 10)
+    weights = [rng.randint(1, 15) for _ in range(n)]
+    values = [rng.randint(0, 30) for _ in range(n)]
+    capacity = rng.randint(1, 50)
+    items = list(range(n))
+    rng.shuffle(items)
+    required = items[:rng.randint(0, 2)]
+    excluded = items[len(required):len(required) + rng.randint(0, 2)]
+    return weights, values, capacity, required, excluded
+
+
+def check_selection(selected, weights, capacity, required, excluded):
+    """A reported selection fits and honours the item constraints"""
+    assert sum(weights[i] for i in selected) <= capacity
+    assert set(required) <= set(selected)
+    assert not set(excluded) & set(selected)
+
+
+def configured(solver_class, weights, values, capacity, required, excluded):
+    """A solver of the given class set up from arrays"""
+    solver = solver_class()
+    solver.configure_from_arrays(weights, values, capacity, excluded=excluded, required=required)
+    return solver
+
+
+def test_single_solution_solvers_against_brute_force(trials=300, seed=11):
+    """DP (both paths) and MITM find the brute-force optimum"""
+    rng = random.Random(seed)
+    for trial in range(trials):
+        weights, values, capacity, required, excluded = random_problem(rng)
+        feasible = brute_force(weights, values, capacity, required, excluded)
+        
+        runs = [
+            (DPKnapsackSolver, lambda solver: solver.solve(show_steps=False)),
+            (DPKnapsackSolver, lambda solver: solver.solve(show_steps=True)),
+            (MeetInTheMiddleKnapsack, lambda solver: solver.solve()),
+        ]
+        for solver_class, solve in runs:
+            solver = configured(solver_class, weights, values, capacity, required, excluded)
+            with quiet_session():
+                solved = solve(solver)
+            
+            if not feasible:
+                assert solved is False, (trial, solver_class.__name__)
+                continue
+            assert solved is True, (trial, solver_class.__name__)
+            check_selection(solver.selected_items, weights, capacity, required, excluded)
+            assert sum(values[i] for i in solver.selected_items) == feasible[0], \
+                (trial, solver_class.__name__)
+
+
+def test_branch_and_bound_top_n_against_brute_force(trials=300, seed=12):
+    """B&B top-N values match the N best feasible selections"""
+    rng = random.Random(seed)
+    for trial in range(trials):
+        weights, values, capacity, required, excluded = random_problem(rng)
+        solver = configured(BranchBoundKnapsack, weights, values, capacity, required, excluded)
+        solver.top_n = rng.randint(1, 6)
+        with quiet_session():
+            solver.solve()
+        
+        expected = brute_force(weights, values, capacity, required, excluded)[:solver.top_n]
+        assert [value for value, _ in solver.top_solutions] == expected, trial
+        assert len({chosen for _, chosen in solver.top_solutions}) == len(expected), trial
+        for value, chosen in solver.top_solutions:
+            selected = [i for i in range(len(weights)) if chosen >> i & 1]
+            check_selection(selected, weights, capacity, required, excluded)
+            assert sum(values[i] for i in selected) == value, trial
+
+
+def test_required_items_over_capacity():
+    """Required items heavier than the knapsack: DP and MITM report failure"""
+    weights, values, capacity, required = [6, 5, 2], [10, 8, 3], 10, [0, 1]
+    
+    for solver_class in (DPKnapsackSolver, MeetInTheMiddleKnapsack):
+        solver = configured(solver_class, weights, values, capacity, required, ())
+        with quiet_session():
+            assert solver.solve() is False, solver_class.__name__
+    
+    solver = configured(BranchBoundKnapsack, weights, values, capacity, required, ())
+    with quiet_session():
+        solver.solve()
+    assert solver.top_solutions == []
+
+
+def test_non_integer_weights_rejected():
+    """Float weights or capacity raise ValueError up front (the DP indexes by them)"""
+    for weights, capacity in (([2.0, 3.0], 5), ([2, 3], 5.0)):
+        try:
+            DPKnapsackSolver().configure_from_arrays(weights, [1, 2], capacity)
+        except ValueError:
+            continue
+        raise AssertionError((weights, capacity))
+
+
+def test_strategy_dispatch():
+    """DP for small tables, MITM for few items with large W, B&B otherwise"""
+    cases = [
+        (10, 20, False, Strategy.DYNAMIC_PROGRAMMING),
+        (20, 10**6, False, Strategy.MEET_IN_THE_MIDDLE),
+        (20, 10**6, True, Strategy.DYNAMIC_PROGRAMMING),
+        (30, 10**9, True, Strategy.MEET_IN_THE_MIDDLE),
+        (60, 10**9, False, Strategy.BRANCH_AND_BOUND),
+    ]
+    for n, capacity, show_steps, expected in cases:
+        solver = DPKnapsackSolver()
+        solver.num_items, solver.capacity = n, capacity
+        assert _choose_strategy(solver, show_steps) is expected, (n, capacity, show_steps)
+
+
+if __name__ == "__main__":
+    tests = [
+        test_single_solution_solvers_against_brute_force,
+        test_branch_and_bound_top_n_against_brute_force,
+        test_required_items_over_capacity,
+        test_non_integer_weights_rejected,
+        test_strategy_dispatch,
+    ]
+    
+    print("=" * 70)
+    print("KNAPSACK SOLVER TESTS")
+    print("=" * 70)
+    
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as error:
+            failed += 1
+            print(f"✗ {test.__name__} (case {error})")
+    
+    print(f"\n{'=' * 70}")
+    print(f"{len(tests) - failed}/{len(tests)} tests PASSED")
+    print("=" * 70)
@@ -14,6 +14,8 @@ This implementation extends the LinearOptimizationEngine with Big-M emphasis.
 ================================================================================
 """
 
+import sys
+
 from simplex_refactored import LinearOptimizationEngine
 
 
@@ -33,64 +35,74 @@ class BigMSolver(LinearOptimizationEngine):
         self.penalty_coefficient = 1000  # Big-M value (already in parent)
         self.artificial_var_count = 0
         self.artificial_var_indices = []
+        self._basis_row_of = {}  # Basic variable index -> tableau row
     
     def display_big_m_banner(self):
         """Display Big-M method welcome banner."""
-        print("\n" + "="*70)
-        print("┃" + " "*20 + "BIG-M METHOD SOLVER" + " "*27 + "┃")
-        print("┃" + " "*15 + "For LP with >= and = Constraints" + " "*19 + "┃")
-        print("="*70)
-        
-        print("\n┌─ BIG-M METHOD EXPLANATION ─┐")
-        print("│")
-        print("│ The Big-M method handles >= and = constraints by:")
-        print("│  1. Adding ARTIFICIAL variables to these constraints")
-        print("│  2. Assigning large penalty M to artificial vars")
-        print("│  3. Using Simplex to minimize artificial variables")
-        print("│  4. If all artificials become 0 → Optimal solution")
-        print("│  5. If artificials remain > 0 → Infeasible problem")
-        print("│")
-        print(f"│ Current M value: {self.penalty_coefficient}")
-        print("└────────────────────────────────┘\n")
+        lines = [
+            "\n" + "="*70,
+            "┃" + " "*20 + "BIG-M METHOD SOLVER" + " "*27 + "┃",
+            "┃" + " "*15 + "For LP with >= and = Constraints" + " "*19 + "┃",
+            "="*70,
+            "\n┌─ BIG-M METHOD EXPLANATION ─┐",
+            "│",
+            "│ The Big-M method handles >= and = constraints by:",
+            "│  1. Adding ARTIFICIAL variables to these constraints",
+            "│  2. Assigning large penalty M to artificial vars",
+            "│  3. Using Simplex to minimize artificial variables",
+            "│  4. If all artificials become 0 → Optimal solution",
+            "│  5. If artificials remain > 0 → Infeasible problem",
+            "│",
+            f"│ Current M value: {self.penalty_coefficient}",
+            "└────────────────────────────────┘\n",
+        ]
+        # One buffered write instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def track_artificial_variables(self):
         """Track which variables are artificial for Big-M analysis."""
-        self.artificial_var_indices = []
-        
-        # Find artificial variables in variable labels
-        for idx, var_name in enumerate(self.variable_labels):
-            if var_name.startswith('a'):  # Artificial variables start with 'a'
-                self.artificial_var_indices.append(idx)
+        # Artificial columns are flagged by position when the tableau is built
+        self.artificial_var_indices = [idx for idx, flag in enumerate(self.is_artificial) if flag]
         
         self.artificial_var_count = len(self.artificial_var_indices)
     
+    def index_basis_rows(self):
+        """Build the basic variable -> tableau row map from the current basis."""
+        self._basis_row_of = {var: row for row, var in enumerate(self.foundation_indices)}
+    
+    def execute_matrix_transformation(self, pivot_row, pivot_col):
+        """Pivot, keeping the basis row map in step (only the pivot row changes)."""
+        self._basis_row_of.pop(self.foundation_indices[pivot_row], None)
+        super().execute_matrix_transformation(pivot_row, pivot_col)
+        self._basis_row_of[pivot_col] = pivot_row
+    
     def display_big_m_status(self):
         """Display current status of artificial variables."""
         if not self.artificial_var_indices:
             print("\n✓ No artificial variables in current basis (Good!)")
             return
         
-        print("\n" + "─"*70)
-        print("BIG-M STATUS: Artificial Variables")
-        print("─"*70)
+        lines = ["\n" + "─"*70, "BIG-M STATUS: Artificial Variables", "─"*70]
         
         artificials_in_basis = []
         for idx in self.foundation_indices:
-            if idx in self.artificial_var_indices:
+            if self.is_artificial[idx]:
                 var_name = self.variable_labels[idx]
                 # Find value in tableau
-                row_idx = self.foundation_indices.index(idx)
+                row_idx = self._basis_row_of[idx]
                 value = self.operational_matrix[row_idx][-1]
                 artificials_in_basis.append((var_name, value))
         
         if artificials_in_basis:
-            print("⚠ WARNING: Artificial variables in basis:")
-            for var_name, value in artificials_in_basis:
-                print(f"   {var_name} = {value:.6f}")
-            print("\n   These must reach 0 for a feasible solution!")
+            lines.append("⚠ WARNING: Artificial variables in basis:")
+            lines.extend(f"   {var_name} = {value:.6f}" for var_name, value in artificials_in_basis)
+            lines.append("\n   These must reach 0 for a feasible solution!")
         else:
-            print("✓ All artificial variables have left the basis")
-            print("  Solution is feasible!")
+            lines.append("✓ All artificial variables have left the basis")
+            lines.append("  Solution is feasible!")
+        
+        # One buffered write instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def commence_solution_process(self):
         """
@@ -104,6 +116,7 @@ class BigMSolver(LinearOptimizationEngine):
         
         # Track artificial variables
         self.track_artificial_variables()
+        self.index_basis_rows()
         
         if self.artificial_var_count > 0:
             print(f"\n🔴 BIG-M ACTIVATED: {self.artificial_var_count} artificial variable(s) added")
@@ -136,7 +149,7 @@ class BigMSolver(LinearOptimizationEngine):
                 
                 # Check if artificial variables remain
                 artificials_in_basis = [idx for idx in self.foundation_indices 
-                                       if idx in self.artificial_var_indices]
+                                       if self.is_artificial[idx]]
                 
                 if artificials_in_basis:
                     print("\n✗ INFEASIBLE PROBLEM DETECTED!")
@@ -161,12 +174,12 @@ class BigMSolver(LinearOptimizationEngine):
             # Phase 3: Pivot operation
             self.execute_matrix_transformation(departing_row, entering_col)
             
-            # Display tableau after pivot
-            self.visualize_current_tableau()
-            
-            # Display Big-M status after each iteration
-            if iteration_num > 0 and self.artificial_var_count > 0:
-                self.display_big_m_status()
+            # Display tableau and Big-M status after the pivot (trace only)
+            if self.should_trace(iteration_num):
+                self.visualize_current_tableau()
+                
+                if self.artificial_var_count > 0:
+                    self.display_big_m_status()
         
         if iteration_num >= maximum_cycles:
             print(f"\n⚠ Maximum iterations ({maximum_cycles}) reached!")
@@ -194,6 +207,7 @@ def application_entry_point():
     print("╚" + "═"*68 + "╝\n")
     
     solver = BigMSolver()
+    solver.verbose = True  # Interactive runs show every tableau
     solver.gather_problem_configuration()
     
     input("\n→ Press ENTER to solve using Big-M method...")
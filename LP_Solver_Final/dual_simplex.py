@@ -15,6 +15,8 @@ Selection Rules:
 Built with zero external dependencies!
 """
 
+import sys
+
 class DualSimplexSolver:
     """
     Dual Simplex Method solver for linear programming.
@@ -29,6 +31,10 @@ class DualSimplexSolver:
         self.iteration = 0
         self.max_iterations = 100
         
+        # Per-iteration trace (tableaux, ratio listings); off for scripted runs
+        self.verbose = False
+        self.trace_every = 0  # With verbose: only every Nth iteration (0 = all)
+        
         # Visual formatting
         self.DIVIDER_HEAVY = "=" * 70
         self.DIVIDER_LIGHT = "-" * 70
@@ -46,7 +52,8 @@ class DualSimplexSolver:
         Returns:
             tuple: (optimal_tableau, basic_vars, is_optimal)
         """
-        self.tableau = [row[:] for row in tableau]
+        # Floats are immutable, so copying each row's references is a full copy
+        self.tableau = list(map(list, tableau))
         self.basic_vars = basic_vars[:]
         self.var_names = var_names[:]
         self.is_maximization = is_maximization
@@ -111,18 +118,15 @@ class DualSimplexSolver:
             print(f"  {self.var_names[old_var]} leaves, {self.var_names[entering_col]} enters")
             
             # Display current tableau
-            self._display_tableau()
+            if self._should_trace():
+                self._display_tableau()
         
         print("\n⚠ Maximum iterations reached!")
         return self.tableau, self.basic_vars, False
     
     def _is_feasible(self):
         """Check if all basic variables are non-negative"""
-        num_constraints = len(self.tableau) - 1
-        for i in range(num_constraints):
-            if self.tableau[i][-1] < -1e-10:
-                return False
-        return True
+        return all(row[-1] >= -1e-10 for row in self.tableau[:-1])
     
     def _find_leaving_variable(self):
         """
@@ -130,16 +134,12 @@ class DualSimplexSolver:
         Returns row index or -1 if none found
         """
         num_constraints = len(self.tableau) - 1
-        most_negative = 0
-        leaving_row = -1
+        if num_constraints == 0:
+            return -1
         
-        for i in range(num_constraints):
-            rhs = self.tableau[i][-1]
-            if rhs < most_negative:
-                most_negative = rhs
-                leaving_row = i
-        
-        return leaving_row
+        # min() keeps the first of equally negative rows, like a strict < scan
+        leaving_row = min(range(num_constraints), key=lambda i: self.tableau[i][-1])
+        return leaving_row if self.tableau[leaving_row][-1] < 0 else -1
     
     def _find_entering_variable(self, leaving_row):
         """
@@ -148,87 +148,75 @@ class DualSimplexSolver:
         Only consider negative elements in leaving row.
         Returns column index or -1 if none found.
         """
-        num_cols = len(self.tableau[0]) - 1
-        obj_row = len(self.tableau) - 1
+        pivot_row = self.tableau[leaving_row]
+        obj_row = self.tableau[-1]
+        # For maximization we want obj_coef >= 0 (dual feasibility): ratio = obj_coef / |a_ij|
+        sign = 1 if self.is_maximization else -1
         
-        min_ratio = float('inf')
-        entering_col = -1
+        # One pass over the leaving row: (ratio, column) for negative pivot elements only
+        candidates = [(sign * obj_row[j] / -a, j)
+                      for j, a in enumerate(pivot_row[:-1]) if a < -1e-10]
         
-        print("\n  Ratio Test (Objective Row / Leaving Row):")
+        if self._should_trace():
+            print("\n  Ratio Test (Objective Row / Leaving Row):")
+            if candidates:
+                print("\n".join(f"    Col {j+1} ({self.var_names[j]}): {obj_row[j]:.4f} / "
+                                f"|{pivot_row[j]:.4f}| = {ratio:.4f}" for ratio, j in candidates))
         
-        for j in range(num_cols):
-            pivot_element = self.tableau[leaving_row][j]
-            
-            # Only consider negative pivot elements
-            if pivot_element < -1e-10:
-                obj_coef = self.tableau[obj_row][j]
-                
-                # For maximization with dual simplex
-                if self.is_maximization:
-                    # We want obj_coef >= 0 (dual feasibility)
-                    # Ratio = obj_coef / |pivot_element|
-                    ratio = obj_coef / abs(pivot_element)
-                else:
-                    ratio = -obj_coef / abs(pivot_element)
-                
-                print(f"    Col {j+1} ({self.var_names[j]}): {obj_coef:.4f} / |{pivot_element:.4f}| = {ratio:.4f}")
-                
-                if ratio >= 0 and ratio < min_ratio:
-                    min_ratio = ratio
-                    entering_col = j
-        
-        if entering_col != -1:
-            print(f"  → Minimum ratio: {min_ratio:.4f} at column {entering_col + 1}")
+        # Ties go to the lowest column index, as tuples compare by ratio then column
+        valid = [c for c in candidates if c[0] >= 0]
+        if not valid:
+            return -1
+        
+        min_ratio, entering_col = min(valid)
+        print(f"  → Minimum ratio: {min_ratio:.4f} at column {entering_col + 1}")
         
         return entering_col
     
+    def _should_trace(self):
+        """True when per-iteration output is wanted for the current iteration"""
+        return self.verbose and (self.trace_every == 0 or self.iteration % self.trace_every == 0)
+    
     def _pivot(self, pivot_row, pivot_col):
-        """Perform pivot operation"""
+        """Perform pivot operation as a rank-1 update (row by row, no per-cell loop)"""
         pivot_element = self.tableau[pivot_row][pivot_col]
         
         # Scale pivot row
-        for j in range(len(self.tableau[0])):
-            self.tableau[pivot_row][j] /= pivot_element
-        
-        # Eliminate from other rows
-        for i in range(len(self.tableau)):
-            if i != pivot_row:
-                multiplier = self.tableau[i][pivot_col]
-                for j in range(len(self.tableau[0])):
-                    self.tableau[i][j] -= multiplier * self.tableau[pivot_row][j]
+        new_pivot = [x / pivot_element for x in self.tableau[pivot_row]]
+        self.tableau[pivot_row] = new_pivot
+        
+        # Eliminate from other rows; rows already zero in the pivot column are untouched
+        for i, row in enumerate(self.tableau):
+            multiplier = row[pivot_col]
+            if i != pivot_row and multiplier != 0:
+                self.tableau[i] = [x - multiplier * p for x, p in zip(row, new_pivot)]
     
     def _display_tableau(self):
         """Display current tableau"""
-        num_constraints = len(self.tableau) - 1
         num_vars = len(self.var_names)
         
-        print(f"\n  Current Tableau:")
-        print("  " + "-" * 60)
+        def cells(row):
+            """The row's variable columns as right-aligned cells, then the RHS"""
+            return "".join(f"{value:>8.3f} " for value in row[:num_vars]) + f"| {row[-1]:>8.3f}"
+        
+        divider = "  " + "-" * 60
+        lines = [f"\n  Current Tableau:", divider]
         
         # Header
-        header = "  Basis | "
-        for name in self.var_names:
-            header += f"{name:>8s} "
-        header += "|      RHS"
-        print(header)
-        print("  " + "-" * 60)
+        lines.append("  Basis | " + "".join(f"{name:>8s} " for name in self.var_names) + "|      RHS")
+        lines.append(divider)
         
         # Constraint rows
-        for i in range(num_constraints):
-            row_str = f"  {self.var_names[self.basic_vars[i]]:>5s} | "
-            for j in range(num_vars):
-                row_str += f"{self.tableau[i][j]:>8.3f} "
-            row_str += f"| {self.tableau[i][-1]:>8.3f}"
-            print(row_str)
+        lines.extend(f"  {self.var_names[basic]:>5s} | " + cells(row)
+                     for basic, row in zip(self.basic_vars, self.tableau[:-1]))
         
         # Objective row
-        print("  " + "-" * 60)
-        row_str = "  Z-row | "
-        for j in range(num_vars):
-            row_str += f"{self.tableau[-1][j]:>8.3f} "
-        row_str += f"| {self.tableau[-1][-1]:>8.3f}"
-        print(row_str)
-        print("  " + "-" * 60)
+        lines.append(divider)
+        lines.append("  Z-row | " + cells(self.tableau[-1]))
+        lines.append(divider)
+        
+        # One buffered write instead of a print (lock + two writes) per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ Unified application combining simplex optimization and sensitivity analysis.
 Features:
 ► Simplex Method (handles all constraint types with Big-M)
 ► Big-M Method (dedicated solver with enhanced visualization)
+► Two-Phase Method (>= and = constraints without a penalty coefficient)
 ► Post-Optimal Sensitivity Analysis
 ► Seamless workflow integration
 ► Zero external dependencies
@@ -13,13 +14,14 @@ Features:
 This integrates:
 - LinearOptimizationEngine (simplex_refactored.py)
 - BigMSolver (big_m_method.py)
+- TwoPhaseSolver (two_phase_method.py)
 - PostOptimalAnalyzer (sensitivity_module.py)
 """
 
-from simplex_refactored import LinearOptimizationEngine
-from big_m_method import BigMSolver
-from dual_simplex import DualSimplexSolver
-from sensitivity_module import PostOptimalAnalyzer
+import sys
+
+# Solver modules are imported inside the entry points that use them, so the
+# menu appears without waiting on any solver import
 
 
 def display_main_menu():
@@ -37,11 +39,19 @@ def display_main_menu():
     print("│ 4. Simplex + Sensitivity Analysis")
     print("│ 5. Big-M + Sensitivity Analysis")
     print("│ 6. Sensitivity Analysis Only")
-    print("│ 7. Exit")
+    print("│ 7. Two-Phase Method (>= and = constraints, no Big-M)")
+    print("│ 8. Two-Phase + Sensitivity Analysis")
+    print("│ 9. Exit")
     print("└──────────────┘")
 
 
-def solve_lp_problem():
+def _configure_trace(solver, verbose, trace_every):
+    """Apply the per-iteration tableau trace settings to a solver"""
+    solver.verbose = verbose
+    solver.trace_every = trace_every
+
+
+def solve_lp_problem(verbose=True, trace_every=0):
     """
     Solve a linear programming problem using the standard simplex method.
     Returns the solved engine instance.
@@ -50,7 +60,10 @@ def solve_lp_problem():
     print("           STANDARD SIMPLEX METHOD")
     print("-"*70)
     
+    from simplex_refactored import LinearOptimizationEngine
+    
     engine = LinearOptimizationEngine()
+    _configure_trace(engine, verbose, trace_every)
     engine.gather_problem_configuration()
     
     input("\n→ Press ENTER to begin optimization...")
@@ -59,7 +72,7 @@ def solve_lp_problem():
     return engine
 
 
-def solve_bigm_problem():
+def solve_bigm_problem(verbose=True, trace_every=0):
     """
     Solve a linear programming problem using the Big-M method.
     Returns the solved engine instance.
@@ -68,7 +81,10 @@ def solve_bigm_problem():
     print("           BIG-M METHOD SOLVER")
     print("-"*70)
     
+    from big_m_method import BigMSolver
+    
     solver = BigMSolver()
+    _configure_trace(solver, verbose, trace_every)
     solver.gather_problem_configuration()
     
     input("\n→ Press ENTER to solve using Big-M method...")
@@ -77,7 +93,28 @@ def solve_bigm_problem():
     return solver
 
 
-def solve_dual_simplex_problem():
+def solve_two_phase_problem(verbose=True, trace_every=0):
+    """
+    Solve a linear programming problem using the Two-Phase method.
+    Returns the solved engine instance.
+    """
+    print("\n" + "-"*70)
+    print("           TWO-PHASE METHOD SOLVER")
+    print("-"*70)
+    
+    from two_phase_method import TwoPhaseSolver
+    
+    solver = TwoPhaseSolver()
+    _configure_trace(solver, verbose, trace_every)
+    solver.gather_problem_configuration()
+    
+    input("\n→ Press ENTER to solve using the Two-Phase method...")
+    solver.commence_solution_process()
+    
+    return solver
+
+
+def solve_dual_simplex_problem(verbose=True, trace_every=0):
     """
     Solve using Dual Simplex method.
     First solve with regular methods, then user can trigger dual simplex if needed.
@@ -91,16 +128,18 @@ def solve_dual_simplex_problem():
     print("  • Current solution is infeasible but dual-feasible")
     print("  • Goal: Restore feasibility while maintaining optimality")
     
-    print("\nFor now, we'll solve your problem using Big-M method,")
-    print("which handles >= and = constraints effectively.")
+    print("\nFor now, we'll solve your problem using the Two-Phase method,")
+    print("which handles >= and = constraints without a Big-M penalty.")
     print("(Dual Simplex restoration feature coming soon!)")
     
     print("\n" + "-"*70)
     print("Enter your problem:")
     print("-"*70)
     
-    # Use Big-M solver with user input
-    solver = BigMSolver()
+    # Use the Two-Phase solver with user input
+    from two_phase_method import TwoPhaseSolver
+    solver = TwoPhaseSolver()
+    _configure_trace(solver, verbose, trace_every)
     solver.gather_problem_configuration()
     
     input("\n→ Press ENTER to solve...")
@@ -121,16 +160,22 @@ def perform_sensitivity_analysis(engine):
     print("-"*70)
     
     try:
+        from sensitivity_module import PostOptimalAnalyzer
         analyzer = PostOptimalAnalyzer(engine)
+        analyzer.verbose = engine.verbose  # --quiet also drops per-column listings
         analyzer.post_optimal_menu()
     except Exception as e:
         print(f"\n✗ Error creating analyzer: {e}")
         print("  Ensure the problem was solved to optimality first.")
 
 
-def main_application():
+def main_application(verbose=True, trace_every=0):
     """
     Main application loop with menu system.
+    
+    Args:
+        verbose: Show the tableau and ratio tests at every iteration
+        trace_every: With verbose, only trace every Nth iteration (0 = all)
     """
     # Storage for last solved engine
     last_solved_engine = None
@@ -143,19 +188,19 @@ def main_application():
             
             if choice == 1:
                 # Simplex only
-                last_solved_engine = solve_lp_problem()
+                last_solved_engine = solve_lp_problem(verbose, trace_every)
                 
             elif choice == 2:
                 # Big-M only
-                last_solved_engine = solve_bigm_problem()
+                last_solved_engine = solve_bigm_problem(verbose, trace_every)
                 
             elif choice == 3:
                 # Dual Simplex
-                last_solved_engine = solve_dual_simplex_problem()
+                last_solved_engine = solve_dual_simplex_problem(verbose, trace_every)
                 
             elif choice == 4:
                 # Simplex + Sensitivity
-                last_solved_engine = solve_lp_problem()
+                last_solved_engine = solve_lp_problem(verbose, trace_every)
                 if last_solved_engine.operational_matrix is not None:
                     response = input("\nProceed to sensitivity analysis? (y/n): ")
                     if response.lower() == 'y':
@@ -163,7 +208,7 @@ def main_application():
                 
             elif choice == 5:
                 # Big-M + Sensitivity
-                last_solved_engine = solve_bigm_problem()
+                last_solved_engine = solve_bigm_problem(verbose, trace_every)
                 if last_solved_engine.operational_matrix is not None:
                     response = input("\nProceed to sensitivity analysis? (y/n): ")
                     if response.lower() == 'y':
@@ -173,11 +218,23 @@ def main_application():
                 # Sensitivity on existing solution
                 if last_solved_engine is None:
                     print("\n⚠ No solution available.")
-                    print("  Please solve a problem first (option 1, 2, 3, 4, or 5).")
+                    print("  Please solve a problem first (option 1, 2, 3, 4, 5, 7, or 8).")
                 else:
                     perform_sensitivity_analysis(last_solved_engine)
                 
             elif choice == 7:
+                # Two-Phase only
+                last_solved_engine = solve_two_phase_problem(verbose, trace_every)
+                
+            elif choice == 8:
+                # Two-Phase + Sensitivity
+                last_solved_engine = solve_two_phase_problem(verbose, trace_every)
+                if last_solved_engine.operational_matrix is not None:
+                    response = input("\nProceed to sensitivity analysis? (y/n): ")
+                    if response.lower() == 'y':
+                        perform_sensitivity_analysis(last_solved_engine)
+                
+            elif choice == 9:
                 # Exit
                 print("\n" + "="*70)
                 print("Thank you for using the Integrated LP Solver!")
@@ -185,7 +242,7 @@ def main_application():
                 break
                 
             else:
-                print("\n⚠ Invalid choice. Please select 1-7.")
+                print("\n⚠ Invalid choice. Please select 1-9.")
                 
         except ValueError:
             print("\n⚠ Invalid input. Please enter a number.")
@@ -197,5 +254,16 @@ def main_application():
             print("  Please try again or report this issue.")
 
 
+def parse_trace_arguments(argv):
+    """Read --quiet and --trace-every N from the command line"""
+    verbose = "--quiet" not in argv
+    trace_every = 0
+    if "--trace-every" in argv:
+        position = argv.index("--trace-every")
+        if position + 1 < len(argv) and argv[position + 1].isdigit():
+            trace_every = int(argv[position + 1])
+    return verbose, trace_every
+
+
 if __name__ == "__main__":
-    main_application()
+    main_application(*parse_trace_arguments(sys.argv[1:]))
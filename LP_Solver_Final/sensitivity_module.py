@@ -8,13 +8,104 @@ Features:
 ► RHS perturbation analysis (shadow prices, dual values)
 ► Objective coefficient variation analysis  
 ► Allowable range computation
+► evaluate_* methods that return results without prompting or printing,
+  for scripted and batch runs
 
 Built entirely with Python standard library - NO external dependencies!
-Integrates seamlessly with LinearOptimizationEngine through imports.
+Works with any solved engine that exports a solution package and its
+basis inverse (LinearOptimizationEngine and its subclasses), without
+importing the solver itself.
 """
 
-from simplex_refactored import LinearOptimizationEngine
-from copy import deepcopy
+import sys
+from itertools import chain
+from operator import mul
+
+_INF = float('inf')  # Unbounded range side; built once, not per comparison
+
+
+# Numeric kernels: plain functions over sequences, shared by the analyzer
+# and usable on their own. They need no compile step or warm-up, so the
+# first call from the interactive menu costs the same as any other
+
+def _matvec(matrix, vector):
+    """Matrix-vector product, one row dot product at a time"""
+    # map/mul keeps the products in C and sums them left to right
+    return [sum(map(mul, row, vector)) for row in matrix]
+
+
+def _ratio_test(column, basic_values):
+    """
+    Allowable (increase, decrease) of a RHS whose B^(-1) column is given.
+    
+    x_B + Δb * column >= 0 must hold, so each row with a positive entry
+    caps the decrease and each row with a negative entry caps the increase.
+    Rows with a (near-)zero entry never limit the change.
+    """
+    # Both bounds in one plain pass: no pair list and no generator frames,
+    # which dominate the cost at the small m these problems have
+    max_increase = max_decrease = _INF
+    for coef, value in zip(column, basic_values):
+        if coef > 1e-10:
+            ratio = value / coef
+            if ratio < max_decrease:
+                max_decrease = ratio
+        elif coef < -1e-10:
+            ratio = -value / coef
+            if ratio < max_increase:
+                max_increase = ratio
+    return max_increase, max_decrease
+
+
+def _rhs_ranges(basis_inverse_columns, basic_values, rhs_values):
+    """
+    (lower, upper) RHS bound lists within which x_B stays non-negative,
+    given B^(-1) column by column.
+    
+    Plain sequences in, plain lists out, so it runs on any basis without
+    an analyzer around it.
+    """
+    lower_bounds = []
+    upper_bounds = []
+    
+    for rhs, sensitivity_column in zip(rhs_values, basis_inverse_columns):
+        # For basic solution to remain feasible:
+        # x_B = B^(-1) * (b + Δb*e_i) >= 0
+        # This gives: x_B_current + Δb * B^(-1)[:,i] >= 0
+        # So: Δb >= -x_B_current[j] / B^(-1)[j,i] for all j where B^(-1)[j,i] > 0
+        #     Δb <= -x_B_current[j] / B^(-1)[j,i] for all j where B^(-1)[j,i] < 0
+        max_increase, max_decrease = _ratio_test(sensitivity_column, basic_values)
+        lower_bounds.append(-_INF if max_decrease == _INF else rhs - max_decrease)
+        upper_bounds.append(_INF if max_increase == _INF else rhs + max_increase)
+    
+    return lower_bounds, upper_bounds
+
+
+def _shifted_reduced_costs(objective_row, basic_row, delta, basic_mask, maximize):
+    """
+    Reduced costs after the cost of the variable basic in basic_row
+    changes by delta. Columns flagged in basic_mask always keep a reduced
+    cost of 0.
+    """
+    step = -delta if maximize else delta
+    # Zipping the mask in reads one flag per column; no index or hashing
+    return [0.0 if is_basic else reduced_cost + step * entry
+            for reduced_cost, entry, is_basic in zip(objective_row, basic_row, basic_mask)]
+
+
+def _price_column(multipliers, column, cost, maximize):
+    """
+    (Zj, reduced cost) of an original column a_j priced with the simplex
+    multipliers y = C_B B^(-1): Zj = y . a_j, reduced cost Zj - cj
+    (cj - Zj when minimizing).
+    """
+    zj = sum(map(mul, multipliers, column))
+    return zj, (zj - cost if maximize else cost - zj)
+
+
+def _format_vector(values, precision=2):
+    """Render values as "[1.00, 2.50]" in one pass"""
+    return "[" + ", ".join(f"{value:.{precision}f}" for value in values) + "]"
 
 
 class PostOptimalAnalyzer:
@@ -25,354 +116,558 @@ class PostOptimalAnalyzer:
     the problem from scratch, using dual values and basis inverse calculations.
     """
     
+    # Constraint symbol by type code (1: <=, 2: >=, 3: =); index 0 is unused
+    INEQUALITY_SYMBOLS = ("", "<=", ">=", "=")
+    
+    QUIET_LISTING_LIMIT = 10  # Violations listed per analysis when verbose is off
+    
+    # Visual formatting
+    DIVIDER_HEAVY = "=" * 70
+    DIVIDER_LIGHT = "-" * 70
+    
+    # The menu never changes, so it is rendered once for the class
+    MENU_BANNER = "\n".join((
+        f"\n{DIVIDER_HEAVY}",
+        "         POST-OPTIMAL SENSITIVITY ANALYSIS MENU",
+        DIVIDER_HEAVY,
+        "\n┌─ Available Analyses ─┐",
+        "│ 1. Changes in RHS / Resource Availability",
+        "│ 2. Changes in Objective Function Coefficients",
+        "│ 3. Changes in Constraint Coefficients",
+        "│ 4. Addition of a New Constraint",
+        "│ 5. Addition of a New Decision Variable",
+        "│ 6. Allowable Ranges Computation",
+        "│ 7. Display Optimal Solution",
+        "│ 8. Return to Main Menu",
+        "└─────────────────────────┘",
+    ))
+    
+    # Fixed attribute set: no per-instance __dict__, and a misspelled
+    # setting (e.g. analyzer.verbos = False) fails loudly instead of being ignored
+    __slots__ = (
+        'solver_engine', 'solution_tableau', 'foundation_variable_set',
+        'optimal_assignments', 'optimal_objective', 'variable_registry',
+        'decision_variable_count', 'restriction_count', 'maximization_flag',
+        'restriction_categories', 'boundary_limits', 'objective_weights',
+        'constraint_coefficients', 'basis_inverse_matrix', 'basis_inverse_columns',
+        'reduced_costs', 'basic_values', 'basic_row_of', 'basic_column_mask', 'basic_variable_names',
+        'decision_values', 'is_basic_decision', 'column_costs', 'basis_costs',
+        'simplex_multipliers', 'marginal_prices', 'constraint_listing',
+        'rhs_solution', 'rhs_ranges', 'range_report',
+        'verbose', '_output', '_emit', 'objective_sense', 'sense_sign', 'optimum_label',
+    )
+    
     def __init__(self, optimization_engine):
         """
         Initialize analyzer with a solved optimization engine instance.
         
         Args:
-            optimization_engine: A solved LinearOptimizationEngine instance
+            optimization_engine: A solved LinearOptimizationEngine instance, or
+                any object with export_solution_package() and
+                extract_basis_inverse_matrix()
         """
-        if not isinstance(optimization_engine, LinearOptimizationEngine):
-            raise TypeError("Engine must be a LinearOptimizationEngine instance")
+        if not (hasattr(optimization_engine, 'export_solution_package') and
+                hasattr(optimization_engine, 'extract_basis_inverse_matrix')):
+            raise TypeError("Engine must provide export_solution_package() and "
+                            "extract_basis_inverse_matrix()")
         
         # Store reference to the solver engine
         self.solver_engine = optimization_engine
         
-        # Extract solution data package
-        self.solution_package = optimization_engine.export_solution_package()
+        # Extract solution data package (unpacked below, not kept alongside)
+        package = optimization_engine.export_solution_package()
         
         # Unpack frequently accessed data
-        self.solution_tableau = self.solution_package['tableau']
-        self.foundation_variable_set = self.solution_package['basic_indices']
-        self.optimal_assignments = self.solution_package['solution_values']
-        self.optimal_objective = self.solution_package['objective_value']
-        self.variable_registry = self.solution_package['variable_names']
+        # The optimal tableau is only ever read here; read-only rows like
+        # B^(-1) below, so every cached slice taken from it stays valid.
+        # Engines that already export tuple rows are kept without a copy
+        self.solution_tableau = tuple(map(tuple, package['tableau']))
+        self.foundation_variable_set = package['basic_indices']
+        self.optimal_assignments = package['solution_values']
+        self.optimal_objective = package['objective_value']
+        self.variable_registry = tuple(package['variable_names'])
         
         # Problem parameters
-        self.decision_variable_count = self.solution_package['decision_count']
-        self.restriction_count = self.solution_package['constraint_count']
-        self.maximization_flag = self.solution_package['is_maximization']
-        self.restriction_categories = self.solution_package['constraint_types']
-        self.boundary_limits = self.solution_package['rhs_values']
-        self.objective_weights = self.solution_package['objective_coefficients']
-        self.constraint_coefficients = self.solution_package['constraint_matrix']
-        
-        # Extract basis inverse for sensitivity calculations
-        self.basis_inverse_matrix = optimization_engine.extract_basis_inverse_matrix()
-        
-        # Visual formatting
-        self.DIVIDER_HEAVY = "=" * 70
-        self.DIVIDER_LIGHT = "-" * 70
-        self.DIVIDER_DASH = "-" * 70
+        self.decision_variable_count = package['decision_count']
+        self.restriction_count = package['constraint_count']
+        self.maximization_flag = package['is_maximization']
+        self.restriction_categories = package['constraint_types']
+        self.boundary_limits = package['rhs_values']
+        self.objective_weights = package['objective_coefficients']
+        self.constraint_coefficients = tuple(map(tuple, package['constraint_matrix']))  # A, read-only rows
+        
+        # Extract basis inverse for sensitivity calculations, once. Stored as
+        # read-only rows: the cached products below are derived from it
+        self.basis_inverse_matrix = tuple(map(tuple, optimization_engine.extract_basis_inverse_matrix()))
+        
+        # B^(-1) e_k is just column k of B^(-1); one transpose up front hands
+        # every RHS query and range its column without gathering it row by row
+        self.basis_inverse_columns = tuple(zip(*self.basis_inverse_matrix))
+        
+        # The two tableau slices every analysis reads, taken once: the reduced
+        # costs (objective row without its RHS) and the basic variable values
+        # (RHS column without the objective entry)
+        self.reduced_costs = self.solution_tableau[-1][:-1]
+        self.basic_values = tuple(row[-1] for row in self.solution_tableau[:-1])
+        
+        # Fixed for the optimal basis, so computed once and shared by every analysis
+        # basic_row_of[j] is the tableau row where column j is basic (-1 if
+        # non-basic), so "which row holds x_j?" is one index, not a scan
+        basic_row_of = [-1] * len(self.reduced_costs)
+        for row_idx, basic_idx in enumerate(self.foundation_variable_set):
+            basic_row_of[basic_idx] = row_idx
+        self.basic_row_of = tuple(basic_row_of)
+        self.basic_column_mask = tuple(row_idx >= 0 for row_idx in basic_row_of)
+        # Name of the variable basic in each row, for the row-by-row listings
+        self.basic_variable_names = tuple(self.variable_registry[var_idx]
+                                          for var_idx in self.foundation_variable_set)
+        
+        # Decision variable values by index (x1 at 0), so hot paths index a
+        # tuple instead of formatting and hashing an "x{i}" key every time;
+        # read-only like the tableau they come from
+        self.decision_values = tuple(self.optimal_assignments[f"x{i+1}"]
+                                     for i in range(self.decision_variable_count))
+        self.is_basic_decision = tuple(value > 1e-10 for value in self.decision_values)
+        
+        # Objective cost of every tableau column; slack/surplus columns cost 0
+        decision_count = self.decision_variable_count
+        self.column_costs = (tuple(self.objective_weights[:decision_count]) +
+                             (0.0,) * (len(self.reduced_costs) - decision_count))
+        # C_B, by tableau row; the basis never changes, so every pricing reuses it
+        self.basis_costs = tuple(map(self.column_costs.__getitem__, self.foundation_variable_set))
+        # Simplex multipliers y = C_B B^(-1) (y_k = C_B . column k of B^(-1)):
+        # pricing any new column is then one dot product with y
+        self.simplex_multipliers = tuple(_matvec(self.basis_inverse_columns, self.basis_costs))
+        self.marginal_prices = self._read_marginal_prices()
+        
+        # Each constraint rendered once ("3x1 + 2x2 <= 10"); the listings at
+        # the top of the RHS and coefficient analyses reuse these strings
+        self.constraint_listing = tuple(
+            f"{self._format_constraint_expression(row)} {self.INEQUALITY_SYMBOLS[ctype]} {rhs}"
+            for row, ctype, rhs in zip(self.constraint_coefficients,
+                                       self.restriction_categories,
+                                       self.boundary_limits)
+        )
+        
+        # B^(-1) b for the original RHS; an RHS change only adds a multiple of
+        # one B^(-1) column to it (linearity), so no query redoes the product.
+        # Left unset until the first RHS query: it is the only O(m^2) step here
+        self.rhs_solution = None
+        self.rhs_ranges = None  # (lower, upper) bound lists, filled on first use
+        self.range_report = None  # Rendered allowable-range lines, filled on first display
+        
+        self.verbose = True  # List every reduced cost / basic row, not just the verdict
+        
+        # Display lines are queued here and written with one call per section
+        self._output = []
+        self._emit = self._output.append
+        
+        # Labels that only depend on the objective sense
+        self.objective_sense = "Maximize" if self.maximization_flag else "Minimize"
+        self.optimum_label = "Maximum" if self.maximization_flag else "Minimum"
+        
+        # +1 when maximizing, -1 when minimizing: a reduced cost times this
+        # sign must stay >= 0 for optimality, so checks need no sense branch
+        self.sense_sign = 1.0 if self.maximization_flag else -1.0
     
     def compute_marginal_prices(self):
         """
         Calculate shadow prices (dual values/marginal prices) for each constraint.
         These indicate how much the objective function would improve per unit
         increase in the RHS of each constraint.
+        
+        The prices only depend on the optimal tableau, so this returns the
+        values read once at construction.
         """
-        marginal_prices = []
+        return self.marginal_prices
+    
+    def _read_marginal_prices(self):
+        """Read the shadow prices off the objective row of the optimal tableau"""
         column_offset = self.decision_variable_count
+        slack_costs = self.reduced_costs[column_offset:column_offset + self.restriction_count]
         
-        for i in range(self.restriction_count):
-            if column_offset + i < len(self.solution_tableau[-1]) - 1:
-                dual_value = self.solution_tableau[-1][column_offset + i]
-                # Adjust sign for maximization
-                if self.maximization_flag:
-                    dual_value = -dual_value
-                marginal_prices.append(dual_value)
-            else:
-                marginal_prices.append(0.0)
+        # Adjust sign for maximization; constraints without a column price at 0
+        if self.maximization_flag:
+            marginal_prices = [-dual_value for dual_value in slack_costs]
+        else:
+            marginal_prices = list(slack_costs)
+        marginal_prices.extend([0.0] * (self.restriction_count - len(slack_costs)))
         
         return marginal_prices
     
-    def analyze_rhs_perturbation(self):
+    def evaluate_rhs_change(self, constraint_idx, new_rhs):
+        """
+        Effect of setting the RHS of one constraint (0-based) to new_rhs,
+        without prompting or printing. Raises ValueError on a bad index.
+        
+        Returns a dict with rhs_delta, basic_values (updated x_B), feasible,
+        and objective_delta / objective (None when infeasible).
+        """
+        if not 0 <= constraint_idx < self.restriction_count:
+            raise ValueError("Constraint index out of range")
+        
+        rhs_delta = new_rhs - self.boundary_limits[constraint_idx]
+        
+        # Calculate B^(-1) * new_rhs = B^(-1) * b + Δb * B^(-1) e_k from the
+        # cached B^(-1) * b: one column read instead of a full product
+        if self.rhs_solution is None:
+            self.rhs_solution = _matvec(self.basis_inverse_matrix, self.boundary_limits)
+        updated_basic_values = [value + rhs_delta * coef
+                                for value, coef in zip(self.rhs_solution,
+                                                       self.basis_inverse_columns[constraint_idx])]
+        
+        is_feasible = not any(val < -1e-10 for val in updated_basic_values)
+        objective_delta = new_objective = None
+        if is_feasible:
+            objective_delta = rhs_delta * self.marginal_prices[constraint_idx]
+            new_objective = self.optimal_objective + objective_delta
+        
+        return {
+            'rhs_delta': rhs_delta,
+            'basic_values': updated_basic_values,
+            'feasible': is_feasible,
+            'objective_delta': objective_delta,
+            'objective': new_objective,
+        }
+    
+    def analyze_rhs_perturbation(self, constraint_idx=None, new_rhs=None):
         """
         Analyze the impact of changing right-hand side (RHS) values.
         Examines how modifying constraint bounds affects the optimal solution.
+        
+        The constraint (0-based) and new RHS are asked for only when not
+        given. Returns the evaluate_rhs_change result.
         """
-        print(f"\n{self.DIVIDER_HEAVY}")
-        print("      SENSITIVITY ANALYSIS: RHS PERTURBATION")
-        print(self.DIVIDER_HEAVY)
+        if constraint_idx is not None and not 0 <= constraint_idx < self.restriction_count:
+            raise ValueError("Constraint index out of range")
+        
+        self._emit(f"\n{self.DIVIDER_HEAVY}")
+        self._emit("      SENSITIVITY ANALYSIS: RHS PERTURBATION")
+        self._emit(self.DIVIDER_HEAVY)
         
         # Display current constraint bounds
-        print("\n┌─ Current Constraint Bounds ─┐")
-        inequality_markers = {1: "<=", 2: ">=", 3: "="}
+        self._emit("\n┌─ Current Constraint Bounds ─┐")
         
-        for i in range(self.restriction_count):
-            constraint_expr = self._format_constraint_expression(
-                self.constraint_coefficients[i]
-            )
-            symbol = inequality_markers[self.restriction_categories[i]]
-            print(f"│ {i+1}. {constraint_expr} {symbol} {self.boundary_limits[i]}")
-        print("└──────────────────────────────┘")
+        for i, constraint in enumerate(self.constraint_listing, 1):
+            self._emit(f"│ {i}. {constraint}")
+        self._emit("└──────────────────────────────┘")
         
         # Select constraint to analyze
-        while True:
+        self._flush_output()
+        while constraint_idx is None:
             try:
                 constraint_num = int(input(f"\n→ Select constraint (1-{self.restriction_count}): "))
                 if 1 <= constraint_num <= self.restriction_count:
+                    constraint_idx = constraint_num - 1
                     break
                 print(f"⚠ Enter a number between 1 and {self.restriction_count}")
             except ValueError:
                 print("⚠ Invalid input")
         
-        constraint_idx = constraint_num - 1
+        constraint_num = constraint_idx + 1
         original_rhs = self.boundary_limits[constraint_idx]
         
         # Get new RHS value
-        while True:
+        while new_rhs is None:
             try:
                 new_rhs = float(input(f"→ Enter new RHS value (current = {original_rhs}): "))
                 break
             except ValueError:
                 print("⚠ Invalid input")
         
-        rhs_delta = new_rhs - original_rhs
+        result = self.evaluate_rhs_change(constraint_idx, new_rhs)
+        rhs_delta = result['rhs_delta']
+        updated_basic_values = result['basic_values']
+        is_feasible = result['feasible']
         
-        print(f"\n{self.DIVIDER_LIGHT}")
-        print("              ANALYSIS PROCEDURE")
-        print(self.DIVIDER_LIGHT)
+        self._emit(f"\n{self.DIVIDER_LIGHT}")
+        self._emit("              ANALYSIS PROCEDURE")
+        self._emit(self.DIVIDER_LIGHT)
         
         # Step 1: Calculate change
-        print(f"\n▶ Step 1: Quantify RHS Modification")
-        print(f"   Original b[{constraint_num}] = {original_rhs}")
-        print(f"   Modified b[{constraint_num}] = {new_rhs}")
-        print(f"   Δb[{constraint_num}] = {rhs_delta}")
+        self._emit(f"\n▶ Step 1: Quantify RHS Modification")
+        self._emit(f"   Original b[{constraint_num}] = {original_rhs}")
+        self._emit(f"   Modified b[{constraint_num}] = {new_rhs}")
+        self._emit(f"   Δb[{constraint_num}] = {rhs_delta}")
         
         # Step 2: Show basis inverse
-        print(f"\n▶ Step 2: Basis Inverse Matrix B^(-1)")
+        self._emit(f"\n▶ Step 2: Basis Inverse Matrix B^(-1)")
         self._display_matrix(self.basis_inverse_matrix, "   B^(-1)")
         
         # Step 3: Calculate new basic solution
-        print(f"\n▶ Step 3: Compute Updated Basic Solution")
-        print("   Formula: x_B(new) = B^(-1) × b(new)")
+        self._emit(f"\n▶ Step 3: Compute Updated Basic Solution")
+        self._emit("   Formula: x_B(new) = B^(-1) × b(new)")
         
-        # Create new RHS vector
+        # Modified RHS vector (shown only; the update below never needs it)
         new_rhs_vector = self.boundary_limits[:]
         new_rhs_vector[constraint_idx] = new_rhs
         
-        print(f"\n   Original RHS: {self.boundary_limits}")
-        print(f"   Modified RHS: {new_rhs_vector}")
-        
-        # Calculate B^(-1) * new_rhs
-        updated_basic_values = []
-        for i in range(self.restriction_count):
-            value = sum(self.basis_inverse_matrix[i][j] * new_rhs_vector[j] 
-                       for j in range(self.restriction_count))
-            updated_basic_values.append(value)
+        self._emit(f"\n   Original RHS: {self.boundary_limits}")
+        self._emit(f"   Modified RHS: {new_rhs_vector}")
         
-        print(f"\n   Updated basic variable values:")
-        for i, val in enumerate(updated_basic_values):
-            var_idx = self.foundation_variable_set[i]
-            var_name = self.variable_registry[var_idx]
-            print(f"      {var_name} = {val:.6f}")
+        self._emit(f"\n   Updated basic variable values:")
+        for var_name, val in zip(self.basic_variable_names, updated_basic_values):
+            self._emit(f"      {var_name} = {val:.6f}")
         
         # Step 4: Feasibility check
-        print(f"\n▶ Step 4: Feasibility Verification")
-        is_feasible = True
-        for i, val in enumerate(updated_basic_values):
-            status_symbol = "✓" if val >= -1e-10 else "✗"
-            status_text = "feasible" if val >= -1e-10 else "VIOLATED"
-            print(f"   [{status_symbol}] Row {i+1}: {val:.6f} ({status_text})")
-            if val < -1e-10:
-                is_feasible = False
+        self._emit(f"\n▶ Step 4: Feasibility Verification")
+        if self.verbose:
+            for i, val in enumerate(updated_basic_values):
+                status_symbol = "✓" if val >= -1e-10 else "✗"
+                status_text = "feasible" if val >= -1e-10 else "VIOLATED"
+                self._emit(f"   [{status_symbol}] Row {i+1}: {val:.6f} ({status_text})")
+        elif is_feasible:
+            self._emit(f"   [✓] All {len(updated_basic_values)} rows feasible")
+        else:
+            # Quiet runs list only the violated rows
+            for i, val in enumerate(updated_basic_values):
+                if val < -1e-10:
+                    self._emit(f"   [✗] Row {i+1}: {val:.6f} (VIOLATED)")
         
         # Step 5: Calculate new objective value
-        print(f"\n▶ Step 5: Objective Function Recalculation")
+        self._emit(f"\n▶ Step 5: Objective Function Recalculation")
         
         if is_feasible:
-            print("\n   ✓ Solution remains FEASIBLE")
+            self._emit("\n   ✓ Solution remains FEASIBLE")
             
             # Calculate using shadow prices
             marginal_prices = self.compute_marginal_prices()
             
-            print(f"\n   Shadow Prices (Marginal Values):")
+            self._emit(f"\n   Shadow Prices (Marginal Values):")
             for i, price in enumerate(marginal_prices):
-                print(f"      y[{i+1}] = {price:.6f}")
+                self._emit(f"      y[{i+1}] = {price:.6f}")
             
-            objective_delta = rhs_delta * marginal_prices[constraint_idx]
-            new_objective = self.optimal_objective + objective_delta
+            objective_delta = result['objective_delta']
+            new_objective = result['objective']
             
-            print(f"\n   Objective Change:")
-            print(f"      ΔZ = Δb × y[{constraint_num}]")
-            print(f"         = {rhs_delta} × {marginal_prices[constraint_idx]:.6f}")
-            print(f"         = {objective_delta:.6f}")
+            self._emit(f"\n   Objective Change:")
+            self._emit(f"      ΔZ = Δb × y[{constraint_num}]")
+            self._emit(f"         = {rhs_delta} × {marginal_prices[constraint_idx]:.6f}")
+            self._emit(f"         = {objective_delta:.6f}")
             
-            print(f"\n   Updated Objective:")
-            print(f"      Z(new) = Z(old) + ΔZ")
-            print(f"             = {self.optimal_objective:.6f} + {objective_delta:.6f}")
-            print(f"             = {new_objective:.6f}")
+            self._emit(f"\n   Updated Objective:")
+            self._emit(f"      Z(new) = Z(old) + ΔZ")
+            self._emit(f"             = {self.optimal_objective:.6f} + {objective_delta:.6f}")
+            self._emit(f"             = {new_objective:.6f}")
             
         else:
-            print("\n   ✗ Solution becomes INFEASIBLE")
-            print("\n   The modification violates non-negativity constraints.")
-            print("   Resolution: Re-optimize using Dual Simplex or Primal Simplex.")
-            new_objective = None
+            self._emit("\n   ✗ Solution becomes INFEASIBLE")
+            self._emit("\n   The modification violates non-negativity constraints.")
+            self._emit("   Resolution: Re-optimize using Dual Simplex or Primal Simplex.")
         
         # Summary
-        print(f"\n{self.DIVIDER_DASH}")
-        print("                    SUMMARY")
-        print(self.DIVIDER_DASH)
-        print(f"\n  Constraint Modified: #{constraint_num}")
-        print(f"  RHS Change: {original_rhs} → {new_rhs} (Δ = {rhs_delta})")
-        print(f"  Original Objective: Z = {self.optimal_objective:.6f}")
+        self._emit(f"\n{self.DIVIDER_LIGHT}")
+        self._emit("                    SUMMARY")
+        self._emit(self.DIVIDER_LIGHT)
+        self._emit(f"\n  Constraint Modified: #{constraint_num}")
+        self._emit(f"  RHS Change: {original_rhs} → {new_rhs} (Δ = {rhs_delta})")
+        self._emit(f"  Original Objective: Z = {self.optimal_objective:.6f}")
         if is_feasible:
-            print(f"  New Objective: Z = {new_objective:.6f}")
-            print(f"  Net Change: ΔZ = {objective_delta:.6f}")
+            self._emit(f"  New Objective: Z = {new_objective:.6f}")
+            self._emit(f"  Net Change: ΔZ = {objective_delta:.6f}")
+        else:
+            self._emit("  New Objective: Requires re-optimization (infeasible)")
+        self._flush_output()
+        return result
+    
+    def evaluate_cost_change(self, var_idx, new_coef):
+        """
+        Effect of setting the objective coefficient of decision variable
+        var_idx (0-based) to new_coef, without prompting or printing.
+        Raises ValueError on a bad index.
+        
+        Returns a dict with coef_delta, is_basic, basic_row (tableau row of a
+        basic variable, -1 if not found), reduced_costs (all updated reduced
+        costs, basic case) or reduced_cost (the variable's own, non-basic
+        case), optimal (None if the basic row was not found) and objective
+        (None unless the basis stays optimal).
+        """
+        if not 0 <= var_idx < self.decision_variable_count:
+            raise ValueError("Variable index out of range")
+        
+        coef_delta = new_coef - self.objective_weights[var_idx]
+        result = {
+            'coef_delta': coef_delta,
+            'is_basic': self.is_basic_decision[var_idx],
+            'basic_row': None,
+            'reduced_costs': None,
+            'reduced_cost': None,
+            'optimal': None,
+            'objective': None,
+        }
+        
+        if result['is_basic']:
+            # Find which row contains this basic variable
+            basic_row_idx = self.basic_row_of[var_idx]
+            result['basic_row'] = basic_row_idx
+            if basic_row_idx < 0:
+                return result
+            
+            # One entry per labelled variable column (RHS excluded)
+            column_count = min(len(self.reduced_costs), len(self.variable_registry))
+            new_reduced_costs = _shifted_reduced_costs(
+                self.reduced_costs[:column_count],
+                self.solution_tableau[basic_row_idx],
+                coef_delta,
+                self.basic_column_mask,
+                self.maximization_flag,
+            )
+            result['reduced_costs'] = new_reduced_costs
+            
+            # Optimality is decided in one pass that stops at the first
+            # violating column
+            sign = self.sense_sign
+            optimal = all(rc * sign >= -1e-10 for rc in new_reduced_costs)
+            if optimal:
+                result['objective'] = self.optimal_objective + coef_delta * self.decision_values[var_idx]
         else:
-            print("  New Objective: Requires re-optimization (infeasible)")
+            # Check reduced cost change
+            old_reduced_cost = self.reduced_costs[var_idx]
+            
+            new_reduced_cost = old_reduced_cost + self.sense_sign * coef_delta
+            optimal = new_reduced_cost * self.sense_sign >= -1e-10
+            result['reduced_cost'] = new_reduced_cost
+            if optimal:
+                result['objective'] = self.optimal_objective
+        
+        result['optimal'] = optimal
+        return result
     
-    def analyze_coefficient_variation(self):
+    def analyze_coefficient_variation(self, var_idx=None, new_coef=None):
         """
         Analyze the impact of changing objective function coefficients.
         Determines if basis remains optimal and calculates new objective value.
+        
+        The variable (0-based) and new coefficient are asked for only when
+        not given. Returns the evaluate_cost_change result.
         """
-        print(f"\n{self.DIVIDER_HEAVY}")
-        print("   SENSITIVITY ANALYSIS: OBJECTIVE COEFFICIENT VARIATION")
-        print(self.DIVIDER_HEAVY)
+        if var_idx is not None and not 0 <= var_idx < self.decision_variable_count:
+            raise ValueError("Variable index out of range")
+        
+        self._emit(f"\n{self.DIVIDER_HEAVY}")
+        self._emit("   SENSITIVITY ANALYSIS: OBJECTIVE COEFFICIENT VARIATION")
+        self._emit(self.DIVIDER_HEAVY)
         
         # Display current objective
-        print("\n┌─ Current Objective Function ─┐")
-        obj_type = "Maximize" if self.maximization_flag else "Minimize"
+        self._emit("\n┌─ Current Objective Function ─┐")
+        obj_type = self.objective_sense
         obj_expr = self._format_constraint_expression(self.objective_weights)
-        print(f"│ {obj_type} Z = {obj_expr}")
-        print("└───────────────────────────────┘")
+        self._emit(f"│ {obj_type} Z = {obj_expr}")
+        self._emit("└───────────────────────────────┘")
         
-        print("\n┌─ Coefficient Values ─┐")
-        for i, coef in enumerate(self.objective_weights):
-            var_status = "BASIC" if self.optimal_assignments[f"x{i+1}"] > 1e-10 else "NON-BASIC"
-            print(f"│ c[{i+1}] = {coef} ({var_status})")
-        print("└───────────────────────┘")
+        self._emit("\n┌─ Coefficient Values ─┐")
+        for i, (coef, is_basic) in enumerate(zip(self.objective_weights, self.is_basic_decision)):
+            var_status = "BASIC" if is_basic else "NON-BASIC"
+            self._emit(f"│ c[{i+1}] = {coef} ({var_status})")
+        self._emit("└───────────────────────┘")
         
         # Select variable
-        while True:
+        self._flush_output()
+        while var_idx is None:
             try:
                 var_num = int(input(f"\n→ Select variable (1-{self.decision_variable_count}): "))
                 if 1 <= var_num <= self.decision_variable_count:
+                    var_idx = var_num - 1
                     break
                 print(f"⚠ Enter 1-{self.decision_variable_count}")
             except ValueError:
                 print("⚠ Invalid input")
         
-        var_idx = var_num - 1
+        var_num = var_idx + 1
         original_coef = self.objective_weights[var_idx]
         
         # Get new coefficient
-        while True:
+        while new_coef is None:
             try:
                 new_coef = float(input(f"→ New coefficient (current c[{var_num}] = {original_coef}): "))
                 break
             except ValueError:
                 print("⚠ Invalid input")
         
-        coef_delta = new_coef - original_coef
+        result = self.evaluate_cost_change(var_idx, new_coef)
+        coef_delta = result['coef_delta']
         
-        print(f"\n{self.DIVIDER_LIGHT}")
-        print("              ANALYSIS PROCEDURE")
-        print(self.DIVIDER_LIGHT)
+        self._emit(f"\n{self.DIVIDER_LIGHT}")
+        self._emit("              ANALYSIS PROCEDURE")
+        self._emit(self.DIVIDER_LIGHT)
         
         # Determine if variable is basic
-        is_basic_var = self.optimal_assignments[f"x{var_num}"] > 1e-10
+        is_basic_var = result['is_basic']
         
-        print(f"\n▶ Step 1: Variable Classification")
+        self._emit(f"\n▶ Step 1: Variable Classification")
         if is_basic_var:
-            print(f"   x[{var_num}] is BASIC (in optimal basis)")
-            print(f"   Current value: x[{var_num}] = {self.optimal_assignments[f'x{var_num}']:.6f}")
+            self._emit(f"   x[{var_num}] is BASIC (in optimal basis)")
+            self._emit(f"   Current value: x[{var_num}] = {self.decision_values[var_idx]:.6f}")
         else:
-            print(f"   x[{var_num}] is NON-BASIC (value = 0)")
+            self._emit(f"   x[{var_num}] is NON-BASIC (value = 0)")
         
-        print(f"\n▶ Step 2: Coefficient Modification")
-        print(f"   Original: c[{var_num}] = {original_coef}")
-        print(f"   Modified: c[{var_num}] = {new_coef}")
-        print(f"   Change: Δc[{var_num}] = {coef_delta}")
+        self._emit(f"\n▶ Step 2: Coefficient Modification")
+        self._emit(f"   Original: c[{var_num}] = {original_coef}")
+        self._emit(f"   Modified: c[{var_num}] = {new_coef}")
+        self._emit(f"   Change: Δc[{var_num}] = {coef_delta}")
         
         if is_basic_var:
-            print(f"\n▶ Step 3: Optimality Check (Basic Variable)")
-            print("   Recalculating reduced costs (Zj - Cj) for all variables")
-            
-            # Find which row contains this basic variable
-            basic_row_idx = -1
-            for i, bv_idx in enumerate(self.foundation_variable_set):
-                if bv_idx == var_idx:
-                    basic_row_idx = i
-                    break
+            self._emit(f"\n▶ Step 3: Optimality Check (Basic Variable)")
+            self._emit("   Recalculating reduced costs (Zj - Cj) for all variables")
             
+            basic_row_idx = result['basic_row']
             if basic_row_idx >= 0:
-                print(f"\n   x[{var_num}] located in tableau row {basic_row_idx + 1}")
-                print("\n   Updated reduced costs:")
+                self._emit(f"\n   x[{var_num}] located in tableau row {basic_row_idx + 1}")
                 
-                optimality_maintained = True
-                for j in range(len(self.solution_tableau[0]) - 1):
-                    if j < len(self.variable_registry):
-                        # Check if current column is basic
-                        is_basic_column = j in self.foundation_variable_set
-                        
-                        if is_basic_column:
-                            new_reduced_cost = 0.0  # Basic variables always have 0 reduced cost
-                        else:
-                            # Calculate change in reduced cost
-                            old_reduced_cost = self.solution_tableau[-1][j]
-                            delta_rc = coef_delta * self.solution_tableau[basic_row_idx][j]
-                            
-                            if self.maximization_flag:
-                                new_reduced_cost = old_reduced_cost - delta_rc
-                            else:
-                                new_reduced_cost = old_reduced_cost + delta_rc
-                        
+                new_reduced_costs = result['reduced_costs']
+                optimality_maintained = result['optimal']
+                
+                # The per-column listing is display only
+                sign = self.sense_sign
+                if self.verbose:
+                    self._emit("\n   Updated reduced costs:")
+                    for var_name, new_reduced_cost in zip(self.variable_registry, new_reduced_costs):
                         # Check optimality condition
-                        is_optimal_val = ((self.maximization_flag and new_reduced_cost >= -1e-10) or
-                                        (not self.maximization_flag and new_reduced_cost <= 1e-10))
-                        
-                        status = "✓" if is_optimal_val else "✗"
-                        if not is_optimal_val:
-                            optimality_maintained = False
-                        
-                        print(f"      [{status}] {self.variable_registry[j]}: {new_reduced_cost:.6f}")
+                        status = "✓" if new_reduced_cost * sign >= -1e-10 else "✗"
+                        self._emit(f"      [{status}] {var_name}: {new_reduced_cost:.6f}")
+                elif not optimality_maintained:
+                    # Quiet runs list only the first few violating columns
+                    violations = [(var_name, rc)
+                                  for var_name, rc in zip(self.variable_registry, new_reduced_costs)
+                                  if rc * sign < -1e-10]
+                    self._emit("\n   Violating reduced costs:")
+                    for var_name, new_reduced_cost in violations[:self.QUIET_LISTING_LIMIT]:
+                        self._emit(f"      [✗] {var_name}: {new_reduced_cost:.6f}")
+                    if len(violations) > self.QUIET_LISTING_LIMIT:
+                        self._emit(f"      ... and {len(violations) - self.QUIET_LISTING_LIMIT} more")
                 
                 if optimality_maintained:
-                    print("\n   ✓ OPTIMALITY PRESERVED")
-                    print("   Current basis remains optimal.")
+                    self._emit("\n   ✓ OPTIMALITY PRESERVED")
+                    self._emit("   Current basis remains optimal.")
                     
                     # Calculate new objective
-                    new_obj = self.optimal_objective + coef_delta * self.optimal_assignments[f"x{var_num}"]
+                    new_obj = result['objective']
                     
-                    print(f"\n▶ Step 4: Objective Recalculation")
-                    print(f"   Z(new) = Z(old) + Δc × x[{var_num}]")
-                    print(f"          = {self.optimal_objective:.6f} + {coef_delta} × {self.optimal_assignments[f'x{var_num}']:.6f}")
-                    print(f"          = {new_obj:.6f}")
+                    self._emit(f"\n▶ Step 4: Objective Recalculation")
+                    self._emit(f"   Z(new) = Z(old) + Δc × x[{var_num}]")
+                    self._emit(f"          = {self.optimal_objective:.6f} + {coef_delta} × {self.decision_values[var_idx]:.6f}")
+                    self._emit(f"          = {new_obj:.6f}")
                 else:
-                    print("\n   ✗ OPTIMALITY VIOLATED")
-                    print("   Current basis no longer optimal. Re-optimization required.")
+                    self._emit("\n   ✗ OPTIMALITY VIOLATED")
+                    self._emit("   Current basis no longer optimal. Re-optimization required.")
         
         else:  # Non-basic variable
-            print(f"\n▶ Step 3: Optimality Check (Non-Basic Variable)")
-            
-            # Check reduced cost change
-            old_reduced_cost = self.solution_tableau[-1][var_idx]
-            
-            if self.maximization_flag:
-                new_reduced_cost = old_reduced_cost + coef_delta
-            else:
-                new_reduced_cost = old_reduced_cost - coef_delta
-            
-            print(f"   Previous reduced cost: {old_reduced_cost:.6f}")
-            print(f"   Updated reduced cost: {new_reduced_cost:.6f}")
+            self._emit(f"\n▶ Step 3: Optimality Check (Non-Basic Variable)")
             
-            if self.maximization_flag:
-                optimal_condition = new_reduced_cost >= -1e-10
-            else:
-                optimal_condition = new_reduced_cost <= 1e-10
+            self._emit(f"   Previous reduced cost: {self.reduced_costs[var_idx]:.6f}")
+            self._emit(f"   Updated reduced cost: {result['reduced_cost']:.6f}")
             
-            if optimal_condition:
-                print(f"\n   ✓ OPTIMALITY PRESERVED")
-                print("   Current solution remains optimal.")
-                print(f"\n▶ Step 4: Objective Value")
-                print(f"   Since x[{var_num}] = 0, coefficient change doesn't affect Z")
-                print(f"   Z(new) = {self.optimal_objective:.6f} (unchanged)")
+            if result['optimal']:
+                self._emit(f"\n   ✓ OPTIMALITY PRESERVED")
+                self._emit("   Current solution remains optimal.")
+                self._emit(f"\n▶ Step 4: Objective Value")
+                self._emit(f"   Since x[{var_num}] = 0, coefficient change doesn't affect Z")
+                self._emit(f"   Z(new) = {self.optimal_objective:.6f} (unchanged)")
             else:
-                print(f"\n   ✗ OPTIMALITY VIOLATED")
-                print(f"   x[{var_num}] should enter basis. Re-optimization required.")
+                self._emit(f"\n   ✗ OPTIMALITY VIOLATED")
+                self._emit(f"   x[{var_num}] should enter basis. Re-optimization required.")
+        self._flush_output()
+        return result
     
     def compute_allowable_ranges(self):
         """
@@ -380,209 +675,244 @@ class PostOptimalAnalyzer:
         within which the current basis remains optimal.
         Uses the dual simplex approach from TOYCO model.
         """
-        print(f"\n{self.DIVIDER_HEAVY}")
-        print("        ALLOWABLE RANGE COMPUTATION")
-        print(self.DIVIDER_HEAVY)
-        
-        print("\n┌─ ALLOWABLE RHS RANGES ─┐")
-        print("│ (Current basis remains optimal within these bounds)")
-        print("└───────────────────────────────────────────────────┘\n")
-        
-        # Get current basic solution values
-        current_basic_values = [self.solution_tableau[i][-1] 
-                               for i in range(self.restriction_count)]
+        self._emit(f"\n{self.DIVIDER_HEAVY}")
+        self._emit("        ALLOWABLE RANGE COMPUTATION")
+        self._emit(self.DIVIDER_HEAVY)
+        
+        self._emit("\n┌─ ALLOWABLE RHS RANGES ─┐")
+        self._emit("│ (Current basis remains optimal within these bounds)")
+        self._emit("└───────────────────────────────────────────────────┘\n")
+        
+        # The report only depends on the optimal tableau, so repeat requests
+        # from the menu just queue the lines rendered the first time
+        if self.range_report is None:
+            self.range_report = self._render_range_report()
+        self._output.extend(self.range_report)
+        self._flush_output()
+    
+    def _render_range_report(self):
+        """Render the per-constraint ranges and shadow prices as display lines"""
+        lines = []
+        lower_bounds, upper_bounds = self.evaluate_rhs_ranges()
         
-        # Calculate RHS ranges using basis inverse
         for constraint_idx in range(self.restriction_count):
-            print(f"  Constraint {constraint_idx + 1}:")
-            print(f"    Current RHS: {self.boundary_limits[constraint_idx]}")
-            
-            # Get the column of B^(-1) corresponding to this constraint
-            # This is the constraint_idx-th column of basis inverse
-            sensitivity_column = [self.basis_inverse_matrix[i][constraint_idx]
-                                 for i in range(self.restriction_count)]
-            
-            # Find allowable increase and decrease
-            # For basic solution to remain feasible:
-            # x_B = B^(-1) * (b + Δb*e_i) >= 0
-            # This gives: x_B_current + Δb * B^(-1)[:,i] >= 0
-            # So: Δb >= -x_B_current[j] / B^(-1)[j,i] for all j where B^(-1)[j,i] > 0
-            #     Δb <= -x_B_current[j] / B^(-1)[j,i] for all j where B^(-1)[j,i] < 0
-            
-            max_increase = float('inf')
-            max_decrease = float('inf')
-            
-            for i in range(self.restriction_count):
-                coef = sensitivity_column[i]
-                current_val = current_basic_values[i]
-                
-                if abs(coef) > 1e-10:
-                    if coef > 0:
-                        # Δb >= -current_val / coef => max decrease
-                        max_decrease = min(max_decrease, current_val / coef)
-                    else:  # coef < 0
-                        # Δb <= -current_val / coef => max increase
-                        max_increase = min(max_increase, -current_val / coef)
-            
-            # Calculate bounds
-            if max_decrease == float('inf'):
-                lower_bound = float('-inf')
-            else:
-                lower_bound = self.boundary_limits[constraint_idx] - max_decrease
+            lines.append(f"  Constraint {constraint_idx + 1}:")
+            lines.append(f"    Current RHS: {self.boundary_limits[constraint_idx]}")
             
-            if max_increase == float('inf'):
-                upper_bound = float('inf')
-            else:
-                upper_bound = self.boundary_limits[constraint_idx] + max_increase
+            lower_bound = lower_bounds[constraint_idx]
+            upper_bound = upper_bounds[constraint_idx]
             
             # Format output
-            if lower_bound == float('-inf'):
+            if lower_bound == -_INF:
                 lower_str = "-∞"
             else:
                 lower_str = f"{lower_bound:.1f}"
             
-            if upper_bound == float('inf'):
+            if upper_bound == _INF:
                 upper_str = "∞"
             else:
                 upper_str = f"{upper_bound:.1f}"
             
-            print(f"    Allowable Range: [{lower_str}, {upper_str}]")
-            print()
+            lines.append(f"    Allowable Range: [{lower_str}, {upper_str}]")
+            lines.append("")
         
-        print("\n┌─ SHADOW PRICES (DUAL VALUES) ─┐")
-        marginal_prices = self.compute_marginal_prices()
-        for i, price in enumerate(marginal_prices):
+        lines.append("\n┌─ SHADOW PRICES (DUAL VALUES) ─┐")
+        for i, price in enumerate(self.compute_marginal_prices()):
             # Display absolute value (shadow prices should be positive for resources)
-            print(f"│ Constraint {i+1}: y[{i+1}] = {abs(price):.6f}")
-        print("└─────────────────────────────────┘")
+            lines.append(f"│ Constraint {i+1}: y[{i+1}] = {abs(price):.6f}")
+        lines.append("└─────────────────────────────────┘")
+        return tuple(lines)
+    
+    def evaluate_rhs_ranges(self):
+        """
+        Lower and upper RHS bounds per constraint within which the current
+        basis stays feasible. They depend only on the optimal tableau, so
+        they are computed on the first call and cached.
+        """
+        if self.rhs_ranges is not None:
+            return self.rhs_ranges
+        
+        self.rhs_ranges = _rhs_ranges(self.basis_inverse_columns, self.basic_values,
+                                      self.boundary_limits)
+        return self.rhs_ranges
+    
+    def evaluate_constraint_coefficient_change(self, constraint_idx, var_idx, new_coef):
+        """
+        Effect of setting coefficient a[constraint_idx, var_idx] (0-based)
+        to new_coef, without prompting or printing. Raises ValueError on a
+        bad index.
+        
+        Returns a dict with coef_delta, is_basic, and for a non-basic
+        variable its unchanged reduced_cost and objective (None otherwise:
+        a basic column change needs re-optimization).
+        """
+        if not 0 <= constraint_idx < self.restriction_count:
+            raise ValueError("Constraint index out of range")
+        if not 0 <= var_idx < self.decision_variable_count:
+            raise ValueError("Variable index out of range")
+        
+        is_basic = self.is_basic_decision[var_idx]
+        return {
+            'coef_delta': new_coef - self.constraint_coefficients[constraint_idx][var_idx],
+            'is_basic': is_basic,
+            'reduced_cost': None if is_basic else self.reduced_costs[var_idx],
+            'objective': None if is_basic else self.optimal_objective,
+        }
     
-    def analyze_constraint_coefficient_change(self):
+    def analyze_constraint_coefficient_change(self, constraint_idx=None, var_idx=None, new_coef=None):
         """
         Analyze the impact of changing a constraint coefficient.
         Examines how modifying the A matrix affects the optimal solution.
+        
+        The constraint, variable (both 0-based) and new coefficient are asked
+        for only when not given. Returns the evaluate_constraint_coefficient_change
+        result.
         """
-        print(f"\n{self.DIVIDER_HEAVY}")
-        print("   SENSITIVITY ANALYSIS: CONSTRAINT COEFFICIENT CHANGE")
-        print(self.DIVIDER_HEAVY)
+        if constraint_idx is not None and not 0 <= constraint_idx < self.restriction_count:
+            raise ValueError("Constraint index out of range")
+        if var_idx is not None and not 0 <= var_idx < self.decision_variable_count:
+            raise ValueError("Variable index out of range")
+        
+        self._emit(f"\n{self.DIVIDER_HEAVY}")
+        self._emit("   SENSITIVITY ANALYSIS: CONSTRAINT COEFFICIENT CHANGE")
+        self._emit(self.DIVIDER_HEAVY)
         
         # Display current constraints
-        print("\n┌─ Current Constraints ─┐")
-        inequality_markers = {1: "<=", 2: ">=", 3: "="}
-        for i in range(self.restriction_count):
-            constraint_expr = self._format_constraint_expression(
-                self.constraint_coefficients[i]
-            )
-            symbol = inequality_markers[self.restriction_categories[i]]
-            print(f"│ {i+1}. {constraint_expr} {symbol} {self.boundary_limits[i]}")
-        print("└───────────────────────┘")
+        self._emit("\n┌─ Current Constraints ─┐")
+        for i, constraint in enumerate(self.constraint_listing, 1):
+            self._emit(f"│ {i}. {constraint}")
+        self._emit("└───────────────────────┘")
         
         # Select constraint
-        while True:
+        self._flush_output()
+        while constraint_idx is None:
             try:
                 constraint_num = int(input(f"\n→ Select constraint (1-{self.restriction_count}): "))
                 if 1 <= constraint_num <= self.restriction_count:
+                    constraint_idx = constraint_num - 1
                     break
                 print(f"⚠ Enter 1-{self.restriction_count}")
             except ValueError:
                 print("⚠ Invalid input")
         
-        constraint_idx = constraint_num - 1
-        
         # Select variable
-        while True:
+        while var_idx is None:
             try:
                 var_num = int(input(f"→ Select variable (1-{self.decision_variable_count}): "))
                 if 1 <= var_num <= self.decision_variable_count:
+                    var_idx = var_num - 1
                     break
                 print(f"⚠ Enter 1-{self.decision_variable_count}")
             except ValueError:
                 print("⚠ Invalid input")
         
-        var_idx = var_num - 1
+        constraint_num = constraint_idx + 1
+        var_num = var_idx + 1
         original_coef = self.constraint_coefficients[constraint_idx][var_idx]
         
         # Get new coefficient
-        while True:
+        while new_coef is None:
             try:
                 new_coef = float(input(f"→ New coefficient a[{constraint_num},{var_num}] (current = {original_coef}): "))
                 break
             except ValueError:
                 print("⚠ Invalid input")
         
-        coef_delta = new_coef - original_coef
+        result = self.evaluate_constraint_coefficient_change(constraint_idx, var_idx, new_coef)
+        coef_delta = result['coef_delta']
         
-        print(f"\n{self.DIVIDER_LIGHT}")
-        print("              ANALYSIS PROCEDURE")
-        print(self.DIVIDER_LIGHT)
+        self._emit(f"\n{self.DIVIDER_LIGHT}")
+        self._emit("              ANALYSIS PROCEDURE")
+        self._emit(self.DIVIDER_LIGHT)
         
-        print(f"\n▶ Step 1: Coefficient Modification")
-        print(f"   Original: a[{constraint_num},{var_num}] = {original_coef}")
-        print(f"   Modified: a[{constraint_num},{var_num}] = {new_coef}")
-        print(f"   Change: Δa[{constraint_num},{var_num}] = {coef_delta}")
+        self._emit(f"\n▶ Step 1: Coefficient Modification")
+        self._emit(f"   Original: a[{constraint_num},{var_num}] = {original_coef}")
+        self._emit(f"   Modified: a[{constraint_num},{var_num}] = {new_coef}")
+        self._emit(f"   Change: Δa[{constraint_num},{var_num}] = {coef_delta}")
         
         # Check if variable is basic
-        is_basic_var = self.optimal_assignments[f"x{var_num}"] > 1e-10
+        is_basic_var = result['is_basic']
         
-        print(f"\n▶ Step 2: Variable Status")
+        self._emit(f"\n▶ Step 2: Variable Status")
         if is_basic_var:
-            print(f"   x[{var_num}] is BASIC (value = {self.optimal_assignments[f'x{var_num}']:.6f})")
-            print("\n   ⚠ Coefficient change affects basic variable!")
-            print("   This may change:")
-            print("     • Feasibility of current solution")
-            print("     • Optimality of current basis")
-            print("\n   Recommendation: Re-optimize from scratch")
+            self._emit(f"   x[{var_num}] is BASIC (value = {self.decision_values[var_idx]:.6f})")
+            self._emit("\n   ⚠ Coefficient change affects basic variable!")
+            self._emit("   This may change:")
+            self._emit("     • Feasibility of current solution")
+            self._emit("     • Optimality of current basis")
+            self._emit("\n   Recommendation: Re-optimize from scratch")
         else:
-            print(f"   x[{var_num}] is NON-BASIC (value = 0)")
-            print("\n   ✓ Coefficient change affects non-basic variable")
-            print("   Current solution values remain unchanged.")
-            print("   Check if optimality is maintained...")
+            self._emit(f"   x[{var_num}] is NON-BASIC (value = 0)")
+            self._emit("\n   ✓ Coefficient change affects non-basic variable")
+            self._emit("   Current solution values remain unchanged.")
+            self._emit("   Check if optimality is maintained...")
             
             # For non-basic variable, check reduced cost
-            print(f"\n▶ Step 3: Optimality Check")
-            print("   Calculating impact on reduced cost...")
-            
-            # Find the column in tableau for this variable
-            old_reduced_cost = self.solution_tableau[-1][var_idx]
+            self._emit(f"\n▶ Step 3: Optimality Check")
+            self._emit("   Calculating impact on reduced cost...")
             
             # Calculate new reduced cost (simplified analysis)
-            print(f"\n   Previous reduced cost: {old_reduced_cost:.6f}")
-            print(f"   Note: Complete analysis requires rebuilding tableau column")
-            print(f"\n   ✓ Solution remains feasible")
-            print(f"   Objective value unchanged: Z = {self.optimal_objective:.6f}")
+            self._emit(f"\n   Previous reduced cost: {result['reduced_cost']:.6f}")
+            self._emit(f"   Note: Complete analysis requires rebuilding tableau column")
+            self._emit(f"\n   ✓ Solution remains feasible")
+            self._emit(f"   Objective value unchanged: Z = {result['objective']:.6f}")
+        self._flush_output()
+        return result
     
-    def analyze_new_constraint_addition(self):
+    def evaluate_new_constraint(self, coefficients, ctype, rhs):
+        """
+        Check the current optimum against a new constraint
+        sum(coefficients[i] * x_i) (ctype) rhs, with ctype 1: <=, 2: >=, 3: =,
+        without prompting or printing. Raises ValueError on bad input.
+        
+        Returns a dict with lhs (at the current solution) and satisfied.
+        """
+        if len(coefficients) != self.decision_variable_count:
+            raise ValueError("Need one coefficient per decision variable")
+        if ctype not in (1, 2, 3):
+            raise ValueError("Constraint type must be 1, 2 or 3")
+        
+        lhs_value = sum(map(mul, coefficients, self.decision_values))
+        if ctype == 1:  # <=
+            satisfied = lhs_value <= rhs + 1e-6
+        elif ctype == 2:  # >=
+            satisfied = lhs_value >= rhs - 1e-6
+        else:  # =
+            satisfied = abs(lhs_value - rhs) <= 1e-6
+        
+        return {'lhs': lhs_value, 'satisfied': satisfied}
+    
+    def analyze_new_constraint_addition(self, new_constraint=None, ctype=None, new_rhs=None):
         """
         Analyze the impact of adding a new constraint to the problem.
         Checks if current solution satisfies the new constraint.
+        
+        The coefficients, type (1-3) and RHS are asked for only when not
+        given. Returns True when the current solution satisfies it.
         """
-        print(f"\n{self.DIVIDER_HEAVY}")
-        print("      SENSITIVITY ANALYSIS: NEW CONSTRAINT ADDITION")
-        print(self.DIVIDER_HEAVY)
+        self._emit(f"\n{self.DIVIDER_HEAVY}")
+        self._emit("      SENSITIVITY ANALYSIS: NEW CONSTRAINT ADDITION")
+        self._emit(self.DIVIDER_HEAVY)
         
-        print("\n┌─ Current Optimal Solution ─┐")
-        for i in range(self.decision_variable_count):
-            print(f"│ x{i+1} = {self.optimal_assignments[f'x{i+1}']:.6f}")
-        print(f"│ Z = {self.optimal_objective:.6f}")
-        print("└─────────────────────────────┘")
+        self._emit("\n┌─ Current Optimal Solution ─┐")
+        for i, value in enumerate(self.decision_values):
+            self._emit(f"│ x{i+1} = {value:.6f}")
+        self._emit(f"│ Z = {self.optimal_objective:.6f}")
+        self._emit("└─────────────────────────────┘")
         
-        print("\n┌─ Enter New Constraint ─┐")
-        print("│ Format: a1*x1 + a2*x2 + ... (≤/≥/=) b")
-        print("└─────────────────────────┘")
+        self._emit("\n┌─ Enter New Constraint ─┐")
+        self._emit("│ Format: a1*x1 + a2*x2 + ... (≤/≥/=) b")
+        self._emit("└─────────────────────────┘")
         
         # Input new constraint coefficients
-        new_constraint = []
-        print(f"\nEnter coefficients for new constraint:")
-        for i in range(self.decision_variable_count):
-            while True:
-                try:
-                    coef = float(input(f"  Coefficient of x{i+1}: "))
-                    new_constraint.append(coef)
-                    break
-                except ValueError:
-                    print("  ⚠ Invalid input")
+        self._flush_output()
+        if new_constraint is None:
+            print(f"\nEnter coefficients for new constraint (or all on the first line):")
+            new_constraint = self._prompt_values(
+                self.decision_variable_count, lambda i: f"  Coefficient of x{i+1}: ")
         
         # Input constraint type
-        while True:
+        while ctype is None:
             try:
                 print("\nConstraint type:")
                 print("  1 = <=  (Less than or equal)")
@@ -591,88 +921,107 @@ class PostOptimalAnalyzer:
                 ctype = int(input("→ Select type (1-3): "))
                 if ctype in [1, 2, 3]:
                     break
+                ctype = None
                 print("⚠ Enter 1, 2, or 3")
             except ValueError:
                 print("⚠ Invalid input")
         
         # Input RHS
-        while True:
+        while new_rhs is None:
             try:
                 new_rhs = float(input("→ Enter RHS value: "))
                 break
             except ValueError:
                 print("⚠ Invalid input")
         
-        print(f"\n{self.DIVIDER_LIGHT}")
-        print("              ANALYSIS PROCEDURE")
-        print(self.DIVIDER_LIGHT)
+        result = self.evaluate_new_constraint(new_constraint, ctype, new_rhs)
+        lhs_value = result['lhs']
+        satisfied = result['satisfied']
+        
+        self._emit(f"\n{self.DIVIDER_LIGHT}")
+        self._emit("              ANALYSIS PROCEDURE")
+        self._emit(self.DIVIDER_LIGHT)
         
         # Display new constraint
-        print(f"\n▶ Step 1: New Constraint")
+        self._emit(f"\n▶ Step 1: New Constraint")
         constraint_expr = self._format_constraint_expression(new_constraint)
-        symbols = {1: "<=", 2: ">=", 3: "="}
-        print(f"   {constraint_expr} {symbols[ctype]} {new_rhs}")
+        self._emit(f"   {constraint_expr} {self.INEQUALITY_SYMBOLS[ctype]} {new_rhs}")
         
         # Evaluate at current solution
-        print(f"\n▶ Step 2: Evaluate at Current Solution")
-        lhs_value = sum(new_constraint[i] * self.optimal_assignments[f"x{i+1}"]
-                       for i in range(self.decision_variable_count))
-        
-        print(f"   LHS value: {lhs_value:.6f}")
-        print(f"   RHS value: {new_rhs:.6f}")
+        self._emit(f"\n▶ Step 2: Evaluate at Current Solution")
+        self._emit(f"   LHS value: {lhs_value:.6f}")
+        self._emit(f"   RHS value: {new_rhs:.6f}")
         
         # Check satisfaction
-        print(f"\n▶ Step 3: Constraint Satisfaction Check")
-        
-        satisfied = False
-        if ctype == 1:  # <=
-            satisfied = lhs_value <= new_rhs + 1e-6
-            print(f"   {lhs_value:.6f} <= {new_rhs:.6f}?")
-        elif ctype == 2:  # >=
-            satisfied = lhs_value >= new_rhs - 1e-6
-            print(f"   {lhs_value:.6f} >= {new_rhs:.6f}?")
-        else:  # =
-            satisfied = abs(lhs_value - new_rhs) <= 1e-6
-            print(f"   {lhs_value:.6f} = {new_rhs:.6f}?")
+        self._emit(f"\n▶ Step 3: Constraint Satisfaction Check")
+        self._emit(f"   {lhs_value:.6f} {self.INEQUALITY_SYMBOLS[ctype]} {new_rhs:.6f}?")
         
-        print(f"\n▶ Step 4: Final Assessment")
+        self._emit(f"\n▶ Step 4: Final Assessment")
         if satisfied:
-            print("   ✓ CONSTRAINT SATISFIED")
-            print("\n   The current optimal solution satisfies the new constraint.")
-            print("   The new constraint is REDUNDANT (inactive).")
-            print("\n   Conclusion:")
-            print("     • Current solution remains optimal")
-            print(f"     • Optimal value: Z = {self.optimal_objective:.6f}")
-            print("     • No action required")
+            self._emit("   ✓ CONSTRAINT SATISFIED")
+            self._emit("\n   The current optimal solution satisfies the new constraint.")
+            self._emit("   The new constraint is REDUNDANT (inactive).")
+            self._emit("\n   Conclusion:")
+            self._emit("     • Current solution remains optimal")
+            self._emit(f"     • Optimal value: Z = {self.optimal_objective:.6f}")
+            self._emit("     • No action required")
         else:
-            print("   ✗ CONSTRAINT VIOLATED")
-            print("\n   The current solution does NOT satisfy the new constraint.")
-            print("   The new constraint is ACTIVE (cuts off current solution).")
-            print("\n   Required Action:")
-            print("     1. Add the constraint to the problem")
-            print("     2. Use Dual Simplex Method to re-optimize")
-            print("     3. OR restart with Primal Simplex")
-            print("\n   Note: Optimal value will likely decrease (for max) or increase (for min)")
+            self._emit("   ✗ CONSTRAINT VIOLATED")
+            self._emit("\n   The current solution does NOT satisfy the new constraint.")
+            self._emit("   The new constraint is ACTIVE (cuts off current solution).")
+            self._emit("\n   Required Action:")
+            self._emit("     1. Add the constraint to the problem")
+            self._emit("     2. Use Dual Simplex Method to re-optimize")
+            self._emit("     3. OR restart with Primal Simplex")
+            self._emit("\n   Note: Optimal value will likely decrease (for max) or increase (for min)")
+        self._flush_output()
         
         return satisfied
     
-    def analyze_new_variable_addition(self):
+    def evaluate_new_variable(self, obj_coef, column):
+        """
+        Price out a new decision variable with objective coefficient
+        obj_coef and constraint column (one entry per constraint), without
+        prompting or printing. Raises ValueError on a bad column length.
+        
+        Returns a dict with basis_costs, multipliers (C_B B^(-1)), zj,
+        reduced_cost and enters (True when the variable would improve the
+        objective).
+        """
+        if len(column) != self.restriction_count:
+            raise ValueError("Need one coefficient per constraint")
+        
+        zj, reduced_cost = _price_column(self.simplex_multipliers, column, obj_coef,
+                                         self.maximization_flag)
+        enters = reduced_cost * self.sense_sign < -1e-6
+        
+        return {'basis_costs': self.basis_costs, 'multipliers': self.simplex_multipliers,
+                'zj': zj, 'reduced_cost': reduced_cost, 'enters': enters}
+    
+    def analyze_new_variable_addition(self, obj_coef=None, constraint_coefs=None, verbose=True):
         """
         Analyze the impact of adding a new decision variable.
         Checks if the new variable would enter the optimal basis.
-        """
-        print(f"\n{self.DIVIDER_HEAVY}")
-        print("     SENSITIVITY ANALYSIS: NEW VARIABLE ADDITION")
-        print(self.DIVIDER_HEAVY)
         
-        print("\n┌─ Enter New Variable Details ─┐")
-        print("│ The new variable xₙ will have:")
-        print("│  • Coefficient in objective function")
-        print("│  • Coefficients in each constraint")
-        print("└────────────────────────────────┘")
+        The objective coefficient and constraint column are asked for only
+        when not given. Returns True when the current solution stays optimal.
+        With verbose=False the report is skipped and only the verdict is
+        computed, for pricing many candidate columns in a loop.
+        """
+        if verbose:
+            self._emit(f"\n{self.DIVIDER_HEAVY}")
+            self._emit("     SENSITIVITY ANALYSIS: NEW VARIABLE ADDITION")
+            self._emit(self.DIVIDER_HEAVY)
+            
+            self._emit("\n┌─ Enter New Variable Details ─┐")
+            self._emit("│ The new variable xₙ will have:")
+            self._emit("│  • Coefficient in objective function")
+            self._emit("│  • Coefficients in each constraint")
+            self._emit("└────────────────────────────────┘")
+            self._flush_output()
         
         # Input objective coefficient
-        while True:
+        while obj_coef is None:
             try:
                 obj_coef = float(input(f"\n→ Objective coefficient cₙ: "))
                 break
@@ -680,85 +1029,72 @@ class PostOptimalAnalyzer:
                 print("⚠ Invalid input")
         
         # Input constraint coefficients
-        constraint_coefs = []
-        print(f"\nEnter constraint coefficients:")
-        for i in range(self.restriction_count):
-            while True:
-                try:
-                    coef = float(input(f"  Coefficient in constraint {i+1}: "))
-                    constraint_coefs.append(coef)
-                    break
-                except ValueError:
-                    print("  ⚠ Invalid input")
+        if constraint_coefs is None:
+            print(f"\nEnter constraint coefficients (or all on the first line):")
+            constraint_coefs = self._prompt_values(
+                self.restriction_count, lambda i: f"  Coefficient in constraint {i+1}: ")
         
-        print(f"\n{self.DIVIDER_LIGHT}")
-        print("              ANALYSIS PROCEDURE")
-        print(self.DIVIDER_LIGHT)
+        result = self.evaluate_new_variable(obj_coef, constraint_coefs)
+        if not verbose:
+            return not result['enters']
+        
+        basis_costs = result['basis_costs']
+        zj = result['zj']
+        reduced_cost = result['reduced_cost']
+        should_enter = result['enters']
+        
+        self._emit(f"\n{self.DIVIDER_LIGHT}")
+        self._emit("              ANALYSIS PROCEDURE")
+        self._emit(self.DIVIDER_LIGHT)
         
         # Show new variable
-        print(f"\n▶ Step 1: New Variable Specification")
+        self._emit(f"\n▶ Step 1: New Variable Specification")
         var_num = self.decision_variable_count + 1
-        print(f"   Variable: x{var_num}")
-        print(f"   Objective: c{var_num} = {obj_coef}")
-        print(f"   Constraint column: {constraint_coefs}")
+        self._emit(f"   Variable: x{var_num}")
+        self._emit(f"   Objective: c{var_num} = {obj_coef}")
+        self._emit(f"   Constraint column: {constraint_coefs}")
         
         # Calculate reduced cost for new variable
-        print(f"\n▶ Step 2: Reduced Cost Calculation")
-        print("   Formula: Zⱼ - cⱼ = ∑(CBᵢ × aᵢⱼ) - cⱼ")
-        
-        # Get current basis costs
-        basis_costs = []
-        for i, var_idx in enumerate(self.foundation_variable_set):
-            if var_idx < self.decision_variable_count:
-                basis_costs.append(self.objective_weights[var_idx])
-            else:
-                basis_costs.append(0.0)  # Slack/surplus has 0 cost
-        
-        print(f"\n   Basis costs: {[f'{c:.2f}' for c in basis_costs]}")
-        print(f"   Constraint coefficients: {[f'{a:.2f}' for a in constraint_coefs]}")
-        
-        # Calculate Zⱼ
-        zj = sum(basis_costs[i] * constraint_coefs[i] for i in range(len(basis_costs)))
+        self._emit(f"\n▶ Step 2: Reduced Cost Calculation")
+        self._emit("   Formula: Zⱼ - cⱼ = CB × B^(-1) × aⱼ - cⱼ")
         
-        if self.maximization_flag:
-            reduced_cost = zj - obj_coef
-        else:
-            reduced_cost = obj_coef - zj
+        self._emit(f"\n   Basis costs: {_format_vector(basis_costs)}")
+        self._emit(f"   Simplex multipliers (CB × B^(-1)): {_format_vector(result['multipliers'])}")
+        self._emit(f"   Constraint coefficients: {_format_vector(constraint_coefs)}")
         
-        print(f"\n   Zⱼ = {zj:.6f}")
-        print(f"   cⱼ = {obj_coef:.6f}")
-        print(f"   Reduced cost (Zⱼ - cⱼ) = {reduced_cost:.6f}")
+        self._emit(f"\n   Zⱼ = {zj:.6f}")
+        self._emit(f"   cⱼ = {obj_coef:.6f}")
+        self._emit(f"   Reduced cost (Zⱼ - cⱼ) = {reduced_cost:.6f}")
         
         # Check optimality
-        print(f"\n▶ Step 3: Optimality Check")
+        self._emit(f"\n▶ Step 3: Optimality Check")
         
         if self.maximization_flag:
-            should_enter = reduced_cost < -1e-6
             condition = "Zⱼ - cⱼ < 0"
         else:
-            should_enter = reduced_cost > 1e-6
             condition = "Zⱼ - cⱼ > 0"
         
-        print(f"   Optimality condition for {('MAX' if self.maximization_flag else 'MIN')}: {condition}")
-        print(f"   Current reduced cost: {reduced_cost:.6f}")
+        self._emit(f"   Optimality condition for {('MAX' if self.maximization_flag else 'MIN')}: {condition}")
+        self._emit(f"   Current reduced cost: {reduced_cost:.6f}")
         
-        print(f"\n▶ Step 4: Final Assessment")
+        self._emit(f"\n▶ Step 4: Final Assessment")
         if should_enter:
-            print("   ✗ VARIABLE SHOULD ENTER BASIS")
-            print(f"\n   Adding x{var_num} would IMPROVE the objective function.")
-            print("\n   Required Action:")
-            print("     1. Add the new variable to the problem")
-            print(f"     2. Let x{var_num} enter the basis (pivot operation)")
-            print("     3. Continue simplex iterations to new optimum")
-            print("\n   Note: Objective will improve (increase for MAX, decrease for MIN)")
+            self._emit("   ✗ VARIABLE SHOULD ENTER BASIS")
+            self._emit(f"\n   Adding x{var_num} would IMPROVE the objective function.")
+            self._emit("\n   Required Action:")
+            self._emit("     1. Add the new variable to the problem")
+            self._emit(f"     2. Let x{var_num} enter the basis (pivot operation)")
+            self._emit("     3. Continue simplex iterations to new optimum")
+            self._emit("\n   Note: Objective will improve (increase for MAX, decrease for MIN)")
         else:
-            print("   ✓ CURRENT SOLUTION REMAINS OPTIMAL")
-            print(f"\n   Adding x{var_num} would NOT improve the objective.")
-            print(f"   The variable x{var_num} would remain non-basic (= 0).")
-            print("\n   Conclusion:")
-            print("     • No change to current solution")
-            print(f"     • Optimal value: Z = {self.optimal_objective:.6f}")
-            print("     • New variable is not attractive")
+            self._emit("   ✓ CURRENT SOLUTION REMAINS OPTIMAL")
+            self._emit(f"\n   Adding x{var_num} would NOT improve the objective.")
+            self._emit(f"   The variable x{var_num} would remain non-basic (= 0).")
+            self._emit("\n   Conclusion:")
+            self._emit("     • No change to current solution")
+            self._emit(f"     • Optimal value: Z = {self.optimal_objective:.6f}")
+            self._emit("     • New variable is not attractive")
+        self._flush_output()
         
         return not should_enter
     
@@ -766,40 +1102,27 @@ class PostOptimalAnalyzer:
         """
         Interactive menu for post-optimal sensitivity analysis.
         """
+        # Menu choice N runs actions[N-1]; the choice after the last returns
+        actions = (
+            self.analyze_rhs_perturbation,
+            self.analyze_coefficient_variation,
+            self.analyze_constraint_coefficient_change,
+            self.analyze_new_constraint_addition,
+            self.analyze_new_variable_addition,
+            self.compute_allowable_ranges,
+            self._display_optimal_solution,
+        )
+        
         while True:
-            print(f"\n{self.DIVIDER_HEAVY}")
-            print("         POST-OPTIMAL SENSITIVITY ANALYSIS MENU")
-            print(self.DIVIDER_HEAVY)
-            
-            print("\n┌─ Available Analyses ─┐")
-            print("│ 1. Changes in RHS / Resource Availability")
-            print("│ 2. Changes in Objective Function Coefficients")
-            print("│ 3. Changes in Constraint Coefficients")
-            print("│ 4. Addition of a New Constraint")
-            print("│ 5. Addition of a New Decision Variable")
-            print("│ 6. Allowable Ranges Computation")
-            print("│ 7. Display Optimal Solution")
-            print("│ 8. Return to Main Menu")
-            print("└─────────────────────────┘")
+            self._emit(self.MENU_BANNER)
+            self._flush_output()
             
             try:
                 selection = int(input("\n→ Your choice: "))
                 
-                if selection == 1:
-                    self.analyze_rhs_perturbation()
-                elif selection == 2:
-                    self.analyze_coefficient_variation()
-                elif selection == 3:
-                    self.analyze_constraint_coefficient_change()
-                elif selection == 4:
-                    self.analyze_new_constraint_addition()
-                elif selection == 5:
-                    self.analyze_new_variable_addition()
-                elif selection == 6:
-                    self.compute_allowable_ranges()
-                elif selection == 7:
-                    self._display_optimal_solution()
-                elif selection == 8:
+                if 1 <= selection <= len(actions):
+                    actions[selection - 1]()
+                elif selection == len(actions) + 1:
                     break
                 else:
                     print("⚠ Invalid choice. Select 1-8.")
@@ -808,50 +1131,90 @@ class PostOptimalAnalyzer:
     
     def _display_optimal_solution(self):
         """Display the optimal solution summary"""
-        print(f"\n{self.DIVIDER_LIGHT}")
-        print("           OPTIMAL SOLUTION SUMMARY")
-        print(self.DIVIDER_LIGHT)
-        
-        print("\n┌─ Decision Variables ─┐")
-        for i in range(self.decision_variable_count):
-            var_name = f"x{i+1}"
-            value = self.optimal_assignments[var_name]
-            print(f"│ {var_name} = {value:.6f}")
-        print("└───────────────────────┘")
-        
-        obj_type = "Maximum" if self.maximization_flag else "Minimum"
-        print(f"\n{obj_type} Z = {self.optimal_objective:.6f}")
-        
-        print("\n┌─ Basic Variables ─┐")
-        for i, var_idx in enumerate(self.foundation_variable_set):
-            var_name = self.variable_registry[var_idx]
-            value = self.solution_tableau[i][-1]
-            print(f"│ {var_name} = {value:.6f}")
-        print("└────────────────────┘")
+        self._emit(f"\n{self.DIVIDER_LIGHT}")
+        self._emit("           OPTIMAL SOLUTION SUMMARY")
+        self._emit(self.DIVIDER_LIGHT)
+        
+        self._emit("\n┌─ Decision Variables ─┐")
+        if self.verbose:
+            self._output.extend(f"│ x{i} = {value:.6f}"
+                                for i, value in enumerate(self.decision_values, 1))
+        else:
+            # Quiet runs list only the non-zero values; at most m of the n
+            # decision variables can be basic, so the rest are summarized
+            nonzero = [(i, value) for i, (value, is_basic)
+                       in enumerate(zip(self.decision_values, self.is_basic_decision), 1)
+                       if is_basic]
+            self._output.extend(f"│ x{i} = {value:.6f}" for i, value in nonzero)
+            zero_count = self.decision_variable_count - len(nonzero)
+            if zero_count:
+                self._emit(f"│ ({zero_count} at zero not shown)")
+        self._emit("└───────────────────────┘")
+        
+        obj_type = self.optimum_label
+        self._emit(f"\n{obj_type} Z = {self.optimal_objective:.6f}")
+        
+        self._emit("\n┌─ Basic Variables ─┐")
+        for var_name, value in zip(self.basic_variable_names, self.basic_values):
+            self._emit(f"│ {var_name} = {value:.6f}")
+        self._emit("└────────────────────┘")
+        self._flush_output()
     
     def _format_constraint_expression(self, coefficients):
         """Format coefficients into a readable expression"""
-        terms = []
-        for idx, coef in enumerate(coefficients):
-            if idx < self.decision_variable_count:
-                var_name = f"x{idx+1}"
-                if idx == 0:
-                    terms.append(f"{coef}{var_name}")
-                else:
-                    if coef >= 0:
-                        terms.append(f"+ {coef}{var_name}")
-                    else:
-                        terms.append(f"- {abs(coef)}{var_name}")
-        return " ".join(terms) if terms else "0"
+        coefficients = coefficients[:self.decision_variable_count]
+        if not coefficients:
+            return "0"
+        
+        # The leading term keeps its own sign; later terms get a +/- joiner
+        # picked by indexing on the sign, so every term is one f-string
+        terms = [f"{coefficients[0]}x1"]
+        terms.extend(f"{'+-'[coef < 0]} {abs(coef)}x{idx}"
+                     for idx, coef in enumerate(coefficients[1:], 2))
+        return " ".join(terms)
+    
+    def _prompt_values(self, count, prompt):
+        """
+        Ask for count numbers, one per prompt(i). A first answer holding all
+        of them (space- or comma-separated) fills the list in one go.
+        """
+        # Sized up front and filled by index; count is known before asking
+        values = [0.0] * count
+        filled = 0
+        while filled < count:
+            entries = input(prompt(filled)).replace(',', ' ').split()
+            try:
+                numbers = [float(entry) for entry in entries]
+            except ValueError:
+                numbers = []
+            
+            if len(numbers) == 1:
+                values[filled] = numbers[0]
+                filled += 1
+            elif not filled and len(numbers) == count:
+                return numbers
+            else:
+                print("  ⚠ Invalid input")
+        return values
     
     def _display_matrix(self, matrix, title="Matrix"):
-        """Display a matrix in formatted layout"""
-        print(f"{title}:")
-        for row in matrix:
-            formatted_row = "  ["
-            formatted_row += ", ".join(f"{val:8.4f}" for val in row)
-            formatted_row += " ]"
-            print(formatted_row)
+        """Queue a matrix in formatted layout (written by the caller's flush)"""
+        self._emit(f"{title}:")
+        if not matrix:
+            return
+        
+        # One format template for the whole matrix: every cell is filled by
+        # a single str.format call over the flattened rows, and the block is
+        # queued as one entry
+        row_format = "  [" + ", ".join(["{:8.4f}"] * len(matrix[0])) + " ]"
+        matrix_format = "\n".join([row_format] * len(matrix))
+        self._emit(matrix_format.format(*chain.from_iterable(matrix)))
+    
+    def _flush_output(self):
+        """Write the queued display lines in a single call and clear the queue"""
+        if self._output:
+            sys.stdout.write("\n".join(self._output) + "\n")
+            self._output.clear()
 
 
 if __name__ == "__main__":
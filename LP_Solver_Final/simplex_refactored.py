@@ -1,10 +1,32 @@
+from operator import mul
 
-from fractions import Fraction
-from copy import deepcopy
+
+def _pivot_in_place(matrix, pivot_row, pivot_col):
+    """
+    Pivot a tableau (list of row lists) on matrix[pivot_row][pivot_col]:
+    scale the pivot row to a leading 1, then clear the pivot column from
+    every other row with one whole-row update each.
+    
+    Rows are replaced in place. Returns (row_idx, multiplier) for each
+    row that was updated, for the caller's trace.
+    """
+    pivot_line = matrix[pivot_row]
+    pivot_value = pivot_line[pivot_col]
+    pivot_line[:] = [value / pivot_value for value in pivot_line]
+    
+    eliminated = []
+    for row_idx, row in enumerate(matrix):
+        if row_idx != pivot_row:
+            multiplier = row[pivot_col]
+            if abs(multiplier) > 1e-10:
+                row[:] = [value - multiplier * p for value, p in zip(row, pivot_line)]
+                eliminated.append((row_idx, multiplier))
+    return eliminated
 
 
 class LinearOptimizationEngine:
     
+    ARTIFICIAL_METHOD = "Big-M method"  # How artificial variables are driven out
     
     def __init__(self):
 
@@ -22,9 +44,14 @@ class LinearOptimizationEngine:
         self.operational_matrix = None    # The simplex tableau
         self.foundation_indices = []      # Indices of basic variables
         self.variable_labels = []         # Names of all variables (x, s, e, a)
+        self.is_artificial = []           # Per tableau column: True for artificial variables
         self.cycle_counter = 0            # Iteration number
         self.penalty_coefficient = 1000   # Big-M value for artificial variables
         
+        # Per-iteration trace (tableaux, ratio listings); off for scripted runs
+        self.verbose = False              # Print per-iteration output at all
+        self.trace_every = 0              # With verbose: only every Nth iteration (0 = all)
+        
         # Visual formatting constants
         self.SEPARATOR_HEAVY = "═" * 70
         self.SEPARATOR_LIGHT = "─" * 70
@@ -241,6 +268,10 @@ class LinearOptimizationEngine:
                         surplus_count + artificial_count + 1)  # +1 for RHS
         total_rows = self.restriction_count + 1  # +1 for objective row
         
+        # Artificial columns form the last block before RHS; flag them by position
+        first_artificial = self.decision_count + slack_count + surplus_count
+        self.is_artificial = [col >= first_artificial for col in range(total_columns - 1)]
+        
         # Initialize tableau with zeros
         self.operational_matrix = [[0.0 for _ in range(total_columns)] 
                                    for _ in range(total_rows)]
@@ -258,10 +289,9 @@ class LinearOptimizationEngine:
         # Populate constraint rows with appropriate variables
         for row_idx in range(self.restriction_count):
             
-            # Fill decision variable coefficients
-            for col_idx in range(self.decision_count):
-                self.operational_matrix[row_idx][col_idx] = \
-                    self.restriction_matrix[row_idx][col_idx]
+            # Fill decision variable coefficients (one slice assignment per row)
+            self.operational_matrix[row_idx][:self.decision_count] = \
+                self.restriction_matrix[row_idx][:self.decision_count]
             
             # Add appropriate auxiliary variables based on constraint type
             if self.restriction_types[row_idx] == 1:  # ≤ constraint
@@ -307,11 +337,9 @@ class LinearOptimizationEngine:
         obj_row_idx = len(self.operational_matrix) - 1
         
         # Fill decision variable coefficients (negated for maximization)
-        for j in range(self.decision_count):
-            if self.maximize_mode:
-                self.operational_matrix[obj_row_idx][j] = -self.optimization_vector[j]
-            else:
-                self.operational_matrix[obj_row_idx][j] = self.optimization_vector[j]
+        costs = self.optimization_vector[:self.decision_count]
+        self.operational_matrix[obj_row_idx][:self.decision_count] = \
+            [-cost for cost in costs] if self.maximize_mode else costs
         
         # Apply Big-M penalties to artificial variables
         total_vars = self.decision_count + slack_count + surplus_count
@@ -335,16 +363,13 @@ class LinearOptimizationEngine:
     def _eliminate_from_objective(self, pivot_row, pivot_col):
        
         """Eliminate a basic variable from the objective row"""
-        obj_row_idx = len(self.operational_matrix) - 1
+        objective_row = self.operational_matrix[-1]
         
-        for col_idx in range(len(self.operational_matrix[obj_row_idx])):
-         
-            if self.maximize_mode:
-                self.operational_matrix[obj_row_idx][col_idx] -= \
-                    self.penalty_coefficient * self.operational_matrix[pivot_row][col_idx]
-            else:
-                self.operational_matrix[obj_row_idx][col_idx] += \
-                    self.penalty_coefficient * self.operational_matrix[pivot_row][col_idx]
+        # One whole-row update, the same rank-1 form as the pivot elimination;
+        # the sense only flips the sign of the penalty step
+        step = -self.penalty_coefficient if self.maximize_mode else self.penalty_coefficient
+        objective_row[:] = [value + step * p
+                            for value, p in zip(objective_row, self.operational_matrix[pivot_row])]
     
     def _show_variable_inventory(self, slack_cnt, surplus_cnt, artificial_cnt):
    
@@ -356,9 +381,13 @@ class LinearOptimizationEngine:
         if surplus_cnt > 0:
             print(f"│ Surplus vars: e₁ to e{surplus_cnt} (for ≥ constraints)")
         if artificial_cnt > 0:
-            print(f"│ Artificial vars: a₁ to a{artificial_cnt} (Big-M method)")
+            print(f"│ Artificial vars: a₁ to a{artificial_cnt} ({self.ARTIFICIAL_METHOD})")
         print("└───────────────────────┘")
     
+    def should_trace(self, iteration):
+        """True when per-iteration output is wanted for this iteration"""
+        return self.verbose and (self.trace_every == 0 or iteration % self.trace_every == 0)
+    
     def visualize_current_tableau(self):
        
         """Render the current tableau in formatted tabular layout"""
@@ -366,13 +395,15 @@ class LinearOptimizationEngine:
         print(f"TABLEAU — Iteration {self.cycle_counter}")
         print(self.SEPARATOR_LIGHT)
         
+        # Dimensions are fixed for the whole display
+        num_columns = len(self.operational_matrix[0]) - 1
+        num_labels = len(self.variable_labels)
+        num_basic = len(self.foundation_indices)
+        
         # Build header
         header_parts = ["Basis |"]
-        for idx in range(len(self.operational_matrix[0]) - 1):
-            if idx < len(self.variable_labels):
-                header_parts.append(f"{self.variable_labels[idx]:>8}")
-            else:
-                header_parts.append(f"{'v'+str(idx):>8}")
+        header_parts.extend(f"{self.variable_labels[idx]:>8}" if idx < num_labels else f"{'v'+str(idx):>8}"
+                            for idx in range(num_columns))
         header_parts.append(" |      RHS")
         header_line = "".join(header_parts)
         
@@ -380,20 +411,16 @@ class LinearOptimizationEngine:
         print(self.SEPARATOR_DASH)
         
         # Print constraint rows
-        for row_idx in range(len(self.operational_matrix) - 1):
-            if row_idx < len(self.foundation_indices):
-                basis_idx = self.foundation_indices[row_idx]
-                if basis_idx < len(self.variable_labels):
-                    basis_label = self.variable_labels[basis_idx]
-                else:
-                    basis_label = f"B{row_idx+1}"
+        for row_idx, row in enumerate(self.operational_matrix[:-1]):
+            basis_idx = self.foundation_indices[row_idx] if row_idx < num_basic else num_labels
+            if basis_idx < num_labels:
+                basis_label = self.variable_labels[basis_idx]
             else:
                 basis_label = f"B{row_idx+1}"
             
             row_parts = [f"{basis_label:>5} |"]
-            for col_idx in range(len(self.operational_matrix[row_idx]) - 1):
-                row_parts.append(f"{self.operational_matrix[row_idx][col_idx]:>8.3f}")
-            row_parts.append(f" | {self.operational_matrix[row_idx][-1]:>8.3f}")
+            row_parts.extend(f"{value:>8.3f}" for value in row[:-1])
+            row_parts.append(f" | {row[-1]:>8.3f}")
             
             print("".join(row_parts))
         
@@ -401,8 +428,7 @@ class LinearOptimizationEngine:
         print(self.SEPARATOR_DASH)
         obj_parts = ["Zj-Cj |"]
         obj_row = self.operational_matrix[-1]
-        for col_idx in range(len(obj_row) - 1):
-            obj_parts.append(f" {obj_row[col_idx]:7.3f}")
+        obj_parts.extend(f" {value:7.3f}" for value in obj_row[:-1])
         obj_parts.append(f" | {obj_row[-1]:>8.3f}")
         
         print("".join(obj_parts))
@@ -442,22 +468,16 @@ class LinearOptimizationEngine:
         Apply minimum ratio test to find which basic variable leaves.
         Returns row index of leaving variable, or -1 if unbounded.
         """
-        ratio_candidates = []
-        
-        for row_idx in range(len(self.operational_matrix) - 1):
-            pivot_element = self.operational_matrix[row_idx][entering_col]
-            
-            if pivot_element > 1e-10:  # Only consider positive denominators
-                rhs_value = self.operational_matrix[row_idx][-1]
-                ratio = rhs_value / pivot_element
-                ratio_candidates.append((ratio, row_idx))
+        # Only consider positive denominators
+        ratio_candidates = [(row[-1] / row[entering_col], row_idx)
+                            for row_idx, row in enumerate(self.operational_matrix[:-1])
+                            if row[entering_col] > 1e-10]
         
         if not ratio_candidates:
             return -1  # Unbounded solution
         
         # Select minimum ratio (with ties broken by first occurrence)
-        ratio_candidates.sort()
-        return ratio_candidates[0][1]
+        return min(ratio_candidates)[1]
     
     def execute_matrix_transformation(self, pivot_row, pivot_col):
         """
@@ -481,23 +501,12 @@ class LinearOptimizationEngine:
         # Update basis
         self.foundation_indices[pivot_row] = pivot_col
         
-        # Step 1: Normalize pivot row
+        # Step 1: Normalize pivot row; Step 2: eliminate from other rows.
+        # The arithmetic runs in one module-level kernel, the trace after it
         print(f"\n→ Step 1: Scale Row {pivot_row+1} by 1/{pivot_value:.4f}")
-        for col_idx in range(len(self.operational_matrix[pivot_row])):
-            self.operational_matrix[pivot_row][col_idx] /= pivot_value
-        
-        # Step 2: Eliminate from other rows
         print("→ Step 2: Row operations for elimination")
-        for row_idx in range(len(self.operational_matrix)):
-            if row_idx != pivot_row:
-                multiplier = self.operational_matrix[row_idx][pivot_col]
-                
-                if abs(multiplier) > 1e-10:
-                    print(f"   R{row_idx+1} ← R{row_idx+1} - ({multiplier:.4f}) × R{pivot_row+1}")
-                    
-                    for col_idx in range(len(self.operational_matrix[row_idx])):
-                        self.operational_matrix[row_idx][col_idx] -= \
-                            multiplier * self.operational_matrix[pivot_row][col_idx]
+        for row_idx, multiplier in _pivot_in_place(self.operational_matrix, pivot_row, pivot_col):
+            print(f"   R{row_idx+1} ← R{row_idx+1} - ({multiplier:.4f}) × R{pivot_row+1}")
     
     def validate_optimality_criteria(self):
         """Check if current solution is optimal"""
@@ -514,15 +523,11 @@ class LinearOptimizationEngine:
         Check if any artificial variables remain in basis with non-zero value.
         This indicates an infeasible problem.
         """
-        artificial_labels = [label for label in self.variable_labels if label.startswith('a')]
-        
         for idx, basis_idx in enumerate(self.foundation_indices):
-            if basis_idx < len(self.variable_labels):
-                var_name = self.variable_labels[basis_idx]
-                if var_name in artificial_labels:
-                    value = self.operational_matrix[idx][-1]
-                    if abs(value) > 1e-6:
-                        return True
+            if basis_idx < len(self.is_artificial) and self.is_artificial[basis_idx]:
+                value = self.operational_matrix[idx][-1]
+                if abs(value) > 1e-6:
+                    return True
         return False
     
     def orchestrate_simplex_iterations(self):
@@ -551,11 +556,14 @@ class LinearOptimizationEngine:
                 print("  (No further improvement possible)")
                 break
             
+            tracing = self.should_trace(self.cycle_counter)
+            
             print(f"\n▶ Finding Entering Variable")
-            print(f"  Examining objective row: ", end="")
-            for val in self.operational_matrix[-1][:-1]:
-                print(f"{val:.3f} ", end="")
-            print()
+            if tracing:
+                print(f"  Examining objective row: ", end="")
+                for val in self.operational_matrix[-1][:-1]:
+                    print(f"{val:.3f} ", end="")
+                print()
             
             if self.maximize_mode:
                 print(f"  Most negative → Column {entering_col+1} ({self.variable_labels[entering_col]})")
@@ -564,16 +572,17 @@ class LinearOptimizationEngine:
             
             # Phase 2: Identify leaving variable (minimum ratio test)
             print(f"\n▶ Minimum Ratio Test")
-            print("  Computing RHS / Column ratios:")
-            
-            for row_idx in range(len(self.operational_matrix) - 1):
-                denominator = self.operational_matrix[row_idx][entering_col]
-                if denominator > 1e-10:
-                    numerator = self.operational_matrix[row_idx][-1]
-                    ratio = numerator / denominator
-                    print(f"  Row {row_idx+1}: {numerator:.3f} / {denominator:.3f} = {ratio:.3f}")
-                else:
-                    print(f"  Row {row_idx+1}: (skipped - non-positive)")
+            if tracing:
+                print("  Computing RHS / Column ratios:")
+                
+                for row_idx in range(len(self.operational_matrix) - 1):
+                    denominator = self.operational_matrix[row_idx][entering_col]
+                    if denominator > 1e-10:
+                        numerator = self.operational_matrix[row_idx][-1]
+                        ratio = numerator / denominator
+                        print(f"  Row {row_idx+1}: {numerator:.3f} / {denominator:.3f} = {ratio:.3f}")
+                    else:
+                        print(f"  Row {row_idx+1}: (skipped - non-positive)")
             
             departing_row = self.select_departing_variable(entering_col)
             
@@ -589,7 +598,8 @@ class LinearOptimizationEngine:
             self.execute_matrix_transformation(departing_row, entering_col)
             
             # Display updated tableau
-            self.visualize_current_tableau()
+            if tracing:
+                self.visualize_current_tableau()
         
         if self.cycle_counter >= maximum_cycles:
             print("\n⚠ ITERATION LIMIT EXCEEDED")
@@ -651,16 +661,14 @@ class LinearOptimizationEngine:
         print("SOLUTION VERIFICATION")
         print(self.SEPARATOR_DASH)
         
+        # Decision values looked up once, then every check is a map/mul dot product
+        values = [solution[f"x{i+1}"] for i in range(self.decision_count)]
+        
         # Verify objective value
-        calculated_z = sum(self.optimization_vector[i] * solution[f"x{i+1}"] 
-                          for i in range(self.decision_count))
+        calculated_z = sum(map(mul, self.optimization_vector, values))
         
         print(f"\nObjective Function Check:")
-        term_list = []
-        for i in range(self.decision_count):
-            coef = self.optimization_vector[i]
-            val = solution[f"x{i+1}"]
-            term_list.append(f"({coef}×{val:.4f})")
+        term_list = [f"({coef}×{val:.4f})" for coef, val in zip(self.optimization_vector, values)]
         
         print(f"  Z = {' + '.join(term_list)}")
         print(f"  Z = {calculated_z:.6f}")
@@ -676,8 +684,7 @@ class LinearOptimizationEngine:
         
         all_satisfied = True
         for i in range(self.restriction_count):
-            lhs = sum(self.restriction_matrix[i][j] * solution[f"x{j+1}"] 
-                     for j in range(self.decision_count))
+            lhs = sum(map(mul, self.restriction_matrix[i], values))
             
             rhs = self.boundary_values[i]
             symbol = inequality_map[self.restriction_types[i]]
@@ -706,9 +713,13 @@ class LinearOptimizationEngine:
         """
         Export comprehensive solution data for post-optimal analysis.
         Returns dictionary with tableau, basis, solution, and metadata.
+        
+        The tableau and constraint matrix come as tuple rows: a read-only
+        snapshot that consumers such as PostOptimalAnalyzer keep as-is
+        instead of copying again.
         """
         return {
-            'tableau': [row[:] for row in self.operational_matrix],
+            'tableau': tuple(map(tuple, self.operational_matrix)),
             'basic_indices': self.foundation_indices[:],
             'solution_values': self.extract_variable_assignments(),
             'objective_value': self.operational_matrix[-1][-1],
@@ -719,7 +730,7 @@ class LinearOptimizationEngine:
             'constraint_types': self.restriction_types[:],
             'rhs_values': self.boundary_values[:],
             'objective_coefficients': self.optimization_vector[:],
-            'constraint_matrix': [row[:] for row in self.restriction_matrix]
+            'constraint_matrix': tuple(map(tuple, self.restriction_matrix))
         }
     
     def extract_basis_inverse_matrix(self):
@@ -728,17 +739,17 @@ class LinearOptimizationEngine:
         The inverse appears in the columns corresponding to original slack/artificial variables.
         """
         n = self.restriction_count
-        basis_inverse = [[0.0 for _ in range(n)] for _ in range(n)]
         
         # Find slack/artificial variable columns (start after decision variables)
         col_offset = self.decision_count
         
-        for i in range(n):
-            for j in range(n):
-                if col_offset + j < len(self.operational_matrix[0]) - 1:
-                    basis_inverse[i][j] = self.operational_matrix[i][col_offset + j]
+        # Columns past the last variable column (RHS) are not part of B^(-1)
+        width = max(min(n, len(self.operational_matrix[0]) - 1 - col_offset), 0)
+        padding = [0.0] * (n - width)
         
-        return basis_inverse
+        # One slice per row instead of an element-wise copy
+        return [row[col_offset:col_offset + width] + padding
+                for row in self.operational_matrix[:n]]
     
     def commence_solution_process(self):
         """Main entry point to solve the problem"""
@@ -756,6 +767,7 @@ def application_entry_point():
     
     while True:
         engine = LinearOptimizationEngine()
+        engine.verbose = True  # Interactive runs show every tableau
         engine.gather_problem_configuration()
         
         input("\n→ Press ENTER to begin optimization...")
@@ -0,0 +1,208 @@
+"""
+Tests for the Two-Phase Method solver
+Known optima, infeasible/unbounded detection, a redundant equality, and
+random problems checked against vertex enumeration
+"""
+
+import contextlib
+import io
+import itertools
+import random
+from fractions import Fraction
+
+from two_phase_method import TwoPhaseSolver
+
+
+def solve_quietly(objective, matrix, rhs, types, maximize):
+    """Solve one problem with all solver output captured; returns (solver, output)"""
+    solver = TwoPhaseSolver()
+    solver.maximize_mode = maximize
+    solver.decision_count = len(objective)
+    solver.restriction_count = len(rhs)
+    solver.optimization_vector = objective
+    solver.restriction_matrix = matrix
+    solver.boundary_values = rhs
+    solver.restriction_types = types  # 1 = <=, 2 = >=, 3 = =
+    
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        solver.commence_solution_process()
+    return solver, buffer.getvalue()
+
+
+def objective_value(solver, objective):
+    """Objective value at the solver's reported optimum"""
+    solution = solver.extract_variable_assignments()
+    return sum(c * solution[f"x{j+1}"] for j, c in enumerate(objective))
+
+
+def test_maximization_with_equality():
+    """
+    Maximize Z = 3x1 + 5x2
+    Subject to: x1 <= 4, 2x2 <= 12, 3x1 + 2x2 = 18
+    Expected: x1 = 2, x2 = 6, Z = 36
+    """
+    objective = [3, 5]
+    solver, output = solve_quietly(objective, [[1, 0], [0, 2], [3, 2]], [4, 12, 18], [1, 1, 3], True)
+    
+    assert "OPTIMAL SOLUTION FOUND" in output
+    assert "(Two-Phase method)" in output and "Big-M" not in output
+    solution = solver.extract_variable_assignments()
+    assert abs(solution["x1"] - 2) < 1e-9 and abs(solution["x2"] - 6) < 1e-9
+    assert abs(objective_value(solver, objective) - 36) < 1e-9
+
+
+def test_minimization_with_surplus():
+    """
+    Minimize Z = 2x1 + 3x2
+    Subject to: x1 + x2 >= 5, x1 >= 2, x2 >= 1
+    Expected: x1 = 4, x2 = 1, Z = 11
+    """
+    objective = [2, 3]
+    solver, output = solve_quietly(objective, [[1, 1], [1, 0], [0, 1]], [5, 2, 1], [2, 2, 2], False)
+    
+    assert "OPTIMAL SOLUTION FOUND" in output
+    solution = solver.extract_variable_assignments()
+    assert abs(solution["x1"] - 4) < 1e-9 and abs(solution["x2"] - 1) < 1e-9
+    assert abs(objective_value(solver, objective) - 11) < 1e-9
+
+
+def test_infeasible_problem():
+    """
+    Maximize Z = x1 + x2
+    Subject to: x1 + x2 <= 1, x1 + x2 >= 2
+    Expected: Phase 1 ends with W > 0 (no feasible solution)
+    """
+    _, output = solve_quietly([1, 1], [[1, 1], [1, 1]], [1, 2], [1, 2], True)
+    
+    assert "INFEASIBLE" in output
+    assert "OPTIMAL SOLUTION FOUND" not in output
+
+
+def test_unbounded_problem():
+    """
+    Maximize Z = x1 + x2
+    Subject to: x1 + x2 >= 2
+    Expected: feasible after Phase 1, unbounded in Phase 2
+    """
+    _, output = solve_quietly([1, 1], [[1, 1]], [2], [2], True)
+    
+    assert "PHASE 1 COMPLETE" in output
+    assert "UNBOUNDED" in output
+
+
+def test_redundant_equality():
+    """
+    Maximize Z = 2x1 + 3x2
+    Subject to: x1 + x2 = 4, 2x1 + 2x2 = 8 (same constraint), x1 <= 3
+    Expected: one artificial stays basic at zero; x2 = 4, Z = 12
+    """
+    objective = [2, 3]
+    solver, output = solve_quietly(objective, [[1, 1], [2, 2], [1, 0]], [4, 8, 3], [3, 3, 1], True)
+    
+    assert "OPTIMAL SOLUTION FOUND" in output
+    artificial_rows = [row_idx for row_idx, basis_idx in enumerate(solver.foundation_indices)
+                       if solver.is_artificial[basis_idx]]
+    assert len(artificial_rows) == 1
+    assert abs(solver.operational_matrix[artificial_rows[0]][-1]) < 1e-9
+    assert abs(objective_value(solver, objective) - 12) < 1e-9
+
+
+def _solve_square(rows, rhs):
+    """Exact solution of a square system by Gauss-Jordan, or None if singular"""
+    size = len(rows)
+    augmented = [row[:] + [b] for row, b in zip(rows, rhs)]
+    for col in range(size):
+        pivot = next((r for r in range(col, size) if augmented[r][col] != 0), None)
+        if pivot is None:
+            return None
+        augmented[col], augmented[pivot] = augmented[pivot], augmented[col]
+        for r in range(size):
+            if r != col and augmented[r][col] != 0:
+                factor = augmented[r][col] / augmented[col][col]
+                augmented[r] = [x - factor * y for x, y in zip(augmented[r], augmented[col])]
+    return [augmented[i][-1] / augmented[i][i] for i in range(size)]
+
+
+def enumerate_vertices(objective, matrix, rhs, types, maximize, box=None):
+    """
+    Best objective over all feasible vertices (exact arithmetic), or None
+    when infeasible. box adds x_j <= box bounds to expose unboundedness.
+    """
+    n = len(objective)
+    unit = [[Fraction(int(j == k)) for k in range(n)] for j in range(n)]
+    constraints = [([Fraction(a) for a in row], Fraction(b), t)
+                   for row, b, t in zip(matrix, rhs, types)]
+    if box:
+        constraints += [(unit[j], Fraction(box), 1) for j in range(n)]
+    hyperplanes = [(row, b) for row, b, _ in constraints] + [(unit[j], Fraction(0)) for j in range(n)]
+    
+    best = None
+    for chosen in itertools.combinations(hyperplanes, n):
+        x = _solve_square([row for row, _ in chosen], [b for _, b in chosen])
+        if x is None or any(v < 0 for v in x):
+            continue
+        feasible = True
+        for row, b, t in constraints:
+            lhs = sum(a * v for a, v in zip(row, x))
+            if (t == 1 and lhs > b) or (t == 2 and lhs < b) or (t == 3 and lhs != b):
+                feasible = False
+                break
+        if feasible:
+            z = sum(Fraction(c) * v for c, v in zip(objective, x))
+            if best is None or (z > best if maximize else z < best):
+                best = z
+    return best
+
+
+def test_random_problems_against_vertex_enumeration(trials=400, seed=4):
+    """Optimal/infeasible/unbounded verdicts and optima match vertex enumeration"""
+    rng = random.Random(seed)
+    for trial in range(trials):
+        n, m = rng.randint(1, 3), rng.randint(1, 3)
+        objective = [rng.randint(-3, 6) for _ in range(n)]
+        matrix = [[rng.randint(-1, 5) for _ in range(n)] for _ in range(m)]
+        rhs = [rng.randint(0, 20) for _ in range(m)]
+        types = [rng.choice([1, 2, 3]) for _ in range(m)]
+        maximize = rng.random() < 0.5
+        
+        solver, output = solve_quietly(objective, matrix, rhs, types, maximize)
+        reference = enumerate_vertices(objective, matrix, rhs, types, maximize)
+        
+        if "INFEASIBLE" in output:
+            assert reference is None, trial
+        elif "UNBOUNDED" in output:
+            boxed = enumerate_vertices(objective, matrix, rhs, types, maximize, box=10**6)
+            assert boxed is not None and abs(boxed) >= 10**5, trial
+        else:
+            assert "OPTIMAL SOLUTION FOUND" in output, trial
+            assert reference is not None, trial
+            assert abs(objective_value(solver, objective) - float(reference)) < 1e-6, trial
+
+
+if __name__ == "__main__":
+    tests = [
+        test_maximization_with_equality,
+        test_minimization_with_surplus,
+        test_infeasible_problem,
+        test_unbounded_problem,
+        test_redundant_equality,
+        test_random_problems_against_vertex_enumeration,
+    ]
+    
+    print("="*70)
+    print("TWO-PHASE METHOD TESTS")
+    print("="*70)
+    
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as error:
+            failed += 1
+            print(f"✗ {test.__name__} (case {error})")
+    
+    print(f"\n{'='*70}")
+    print(f"{len(tests) - failed}/{len(tests)} tests PASSED")
+    print(f"{'='*70}")
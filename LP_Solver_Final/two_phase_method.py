@@ -0,0 +1,222 @@
+"""
+TWO-PHASE METHOD SOLVER
+================================================================================
+Solver for Linear Programming problems with >= and = constraints that needs
+no penalty coefficient.
+
+The Two-Phase method works by:
+1. Adding artificial variables to >= and = constraints (same tableau as Big-M)
+2. Phase 1: minimizing the sum of the artificial variables
+3. If that minimum is above zero → the problem is infeasible
+4. Phase 2: restoring the original objective on the Phase 1 basis and
+   continuing the simplex method with artificial columns barred from entering
+
+Unlike Big-M, no large M ever enters the objective row, so reduced costs stay
+on the scale of the problem data and ratio tests are not swamped by M.
+================================================================================
+"""
+
+from simplex_refactored import LinearOptimizationEngine
+
+
+class TwoPhaseSolver(LinearOptimizationEngine):
+    """
+    Two-Phase Method solver for LP problems requiring artificial variables.
+    
+    Both phases keep the objective row as Zj - Cj, so the RHS of that row is
+    the objective value and the inherited entering/leaving rules apply as-is.
+    """
+    
+    FEASIBILITY_TOLERANCE = 1e-6  # Phase 1 optimum above this means infeasible
+    ARTIFICIAL_METHOD = "Two-Phase method"
+    
+    def __init__(self):
+        """Initialize Two-Phase solver."""
+        super().__init__()
+        self.phase = 1
+        self.maximum_cycles = 50  # Per phase
+    
+    def display_two_phase_banner(self):
+        """Display Two-Phase method welcome banner."""
+        print("\n" + "="*70)
+        print("┃" + " "*18 + "TWO-PHASE METHOD SOLVER" + " "*25 + "┃")
+        print("┃" + " "*15 + "For LP with >= and = Constraints" + " "*19 + "┃")
+        print("="*70)
+        
+        print("\n┌─ TWO-PHASE METHOD EXPLANATION ─┐")
+        print("│")
+        print("│ Phase 1: minimize W = sum of artificial variables")
+        print("│   • W = 0  → a feasible basis has been found")
+        print("│   • W > 0  → the problem is infeasible")
+        print("│ Phase 2: optimize the original objective from that basis")
+        print("│   • Artificial variables are never allowed back in")
+        print("│")
+        print("└─────────────────────────────────┘\n")
+    
+    def _initialize_objective_row(self, slack_count, surplus_count, artificial_count):
+        """Set up the Phase 1 row: W = sum of artificials, as Zj - Cj (no Big-M)"""
+        self._load_objective([1.0 if flag else 0.0 for flag in self.is_artificial])
+    
+    def _load_objective(self, costs):
+        """Write Zj - Cj for the given column costs into the objective row
+        
+        Starts from -Cj and eliminates every basic column, which leaves
+        c_B B^-1 A - c in the row and c_B B^-1 b (the objective) in its RHS.
+        """
+        objective = [-c for c in costs] + [0.0]
+        for row_idx, basis_idx in enumerate(self.foundation_indices):
+            multiplier = objective[basis_idx]
+            if multiplier != 0:
+                row = self.operational_matrix[row_idx]
+                objective = [value - multiplier * r for value, r in zip(objective, row)]
+        self.operational_matrix[-1][:] = objective
+    
+    def identify_entering_candidate(self):
+        """
+        Phase 1 minimizes W; Phase 2 follows the problem's own sense but
+        skips artificial columns so they cannot re-enter the basis.
+        """
+        objective_row = self.operational_matrix[-1][:-1]
+        if self.phase == 1:
+            candidates = range(len(objective_row))
+            maximize = False
+        else:
+            candidates = [j for j in range(len(objective_row)) if not self.is_artificial[j]]
+            maximize = self.maximize_mode
+        
+        if maximize:
+            # For maximization: find most negative Zj - Cj
+            entering_col = min(candidates, key=objective_row.__getitem__)
+            return -1 if objective_row[entering_col] >= -1e-10 else entering_col
+        
+        # For minimization: find most positive Zj - Cj
+        entering_col = max(candidates, key=objective_row.__getitem__)
+        return -1 if objective_row[entering_col] <= 1e-10 else entering_col
+    
+    def _run_phase(self):
+        """
+        Iterate the simplex method for the current phase.
+        Returns 'optimal', 'unbounded' or 'limit'.
+        """
+        for _ in range(self.maximum_cycles):
+            entering_col = self.identify_entering_candidate()
+            if entering_col == -1:
+                return 'optimal'
+            
+            self.cycle_counter += 1
+            print(f"\n{'◆'*35}")
+            print(f"     PHASE {self.phase} — ITERATION {self.cycle_counter}")
+            print(f"{'◆'*35}")
+            
+            departing_row = self.select_departing_variable(entering_col)
+            if departing_row == -1:
+                return 'unbounded'
+            
+            self.execute_matrix_transformation(departing_row, entering_col)
+            if self.should_trace(self.cycle_counter):
+                self.visualize_current_tableau()
+        
+        return 'limit'
+    
+    def _drive_out_artificials(self):
+        """
+        Pivot zero-level artificial variables out of the basis after Phase 1.
+        A row with no usable non-artificial entry is redundant; its artificial
+        stays basic at zero and no later pivot can change it.
+        """
+        for row_idx, basis_idx in enumerate(self.foundation_indices):
+            if not self.is_artificial[basis_idx]:
+                continue
+            
+            row = self.operational_matrix[row_idx]
+            for col_idx in range(len(row) - 1):
+                if not self.is_artificial[col_idx] and abs(row[col_idx]) > 1e-10:
+                    print(f"\n→ {self.variable_labels[basis_idx]} is basic at zero; pivoting it out")
+                    self.execute_matrix_transformation(row_idx, col_idx)
+                    break
+    
+    def commence_solution_process(self):
+        """Solve with Phase 1 (feasibility) followed by Phase 2 (optimality)."""
+        self.display_two_phase_banner()
+        
+        self.phase = 1
+        self.construct_canonical_matrix()
+        
+        if any(self.is_artificial):
+            print("\n" + "="*70)
+            print("         PHASE 1: MINIMIZE SUM OF ARTIFICIAL VARIABLES")
+            print("="*70)
+            
+            status = self._run_phase()
+            if status == 'limit':
+                print(f"\n⚠ Maximum iterations ({self.maximum_cycles}) reached in Phase 1!")
+                return
+            
+            # Phase 1 is bounded below by 0, so it always ends optimal here
+            phase_one_value = self.operational_matrix[-1][-1]
+            print(f"\n✓ PHASE 1 COMPLETE: W = {phase_one_value:.6f}")
+            
+            if phase_one_value > self.FEASIBILITY_TOLERANCE:
+                print("\n✗ INFEASIBLE PROBLEM DETECTED!")
+                print("  (Sum of artificial variables cannot reach 0)")
+                print("\n🔴 This means the constraint set has NO feasible solution!")
+                return
+            
+            self._drive_out_artificials()
+        else:
+            print("\n✓ No artificial variables needed (all <= constraints) - skipping Phase 1")
+        
+        # Phase 2: original objective on the feasible basis
+        self.phase = 2
+        print("\n" + "="*70)
+        print("         PHASE 2: OPTIMIZE THE ORIGINAL OBJECTIVE")
+        print("="*70)
+        
+        costs = [0.0] * (len(self.operational_matrix[0]) - 1)
+        costs[:self.decision_count] = self.optimization_vector
+        self._load_objective(costs)
+        self.visualize_current_tableau()
+        
+        status = self._run_phase()
+        if status == 'unbounded':
+            print("\n✗ UNBOUNDED SOLUTION!")
+            print("  The objective function can improve indefinitely.")
+            return
+        if status == 'limit':
+            print(f"\n⚠ Maximum iterations ({self.maximum_cycles}) reached in Phase 2!")
+            return
+        
+        print("\n✓ OPTIMAL SOLUTION REACHED!")
+        self.assemble_final_solution()
+    
+    def assemble_final_solution(self):
+        """Display the optimal solution with a Two-Phase success message."""
+        print("\n" + "="*70)
+        print("            ★ OPTIMAL SOLUTION FOUND (TWO-PHASE) ★")
+        print("="*70)
+        
+        self.present_optimal_solution()
+        
+        print("\n✓ TWO-PHASE METHOD SUCCESSFUL!")
+        print("  No penalty coefficient was needed.")
+
+
+def application_entry_point():
+    """
+    Main entry point for Two-Phase Method solver application.
+    """
+    print("\n" + "╔" + "═"*68 + "╗")
+    print("║" + " "*14 + "WELCOME TO TWO-PHASE METHOD SOLVER" + " "*20 + "║")
+    print("║" + " "*10 + "Solve LP Problems with >= and = Constraints" + " "*15 + "║")
+    print("╚" + "═"*68 + "╝\n")
+    
+    solver = TwoPhaseSolver()
+    solver.verbose = True  # Interactive runs show every tableau
+    solver.gather_problem_configuration()
+    
+    input("\n→ Press ENTER to solve using the Two-Phase method...")
+    solver.commence_solution_process()
+
+
+if __name__ == "__main__":
+    application_entry_point()
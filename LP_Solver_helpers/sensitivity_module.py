@@ -14,7 +14,6 @@ Integrates seamlessly with LinearOptimizationEngine through imports.
 """
 
 from simplex_refactored import LinearOptimizationEngine
-from copy import deepcopy
 
 
 class PostOptimalAnalyzer:
@@ -1,6 +1,5 @@
 
 from fractions import Fraction
-from copy import deepcopy
 
 
 class LinearOptimizationEngine: